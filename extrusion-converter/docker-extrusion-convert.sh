@@ -16,6 +16,9 @@ show_help() {
     echo "Commands:"
     echo "  build             Build the Docker image"
     echo "  convert           Convert STEP files in the source directory"
+    echo "  watch             Keep converting new or modified STEP files as they appear"
+    echo "  enqueue           Queue new or modified STEP files for workers"
+    echo "  worker            Run a queue worker (start one per host on a shared --dir)"
     echo "  clean             Remove temporary files and containers"
     echo "  help              Show this help message"
     echo ""
@@ -23,20 +26,29 @@ show_help() {
     echo "  --dir=PATH        Set the host directory (default: $HOST_DIR)"
     echo "  --image=NAME      Set the Docker image name (default: $IMAGE_NAME)"
     echo "  --force           Force rebuild of Docker image (for build command)"
+    echo "  --debounce=SEC    Quiet period before a batch is converted (for watch command)"
+    echo "  --drain           Stop the worker once the queue is empty (for worker command)"
+    echo "  --max-memory=SIZE Memory budget such as 2G for large models (convert, watch, worker)"
     echo ""
     echo "Examples:"
     echo "  $0 build                   # Build the Docker image"
     echo "  $0 convert                 # Convert all STEP files in source directory"
     echo "  $0 convert --dir=/data     # Specify a different directory"
+    echo "  $0 watch                   # Convert files as they are copied into source"
+    echo "  $0 enqueue --dir=/mnt/shared && $0 worker --dir=/mnt/shared --drain"
+    echo "                             # Spread a conversion over every host running a worker"
     echo ""
 }
 
 # Parse command line arguments
 COMMAND=""
 FORCE_REBUILD=false
+DEBOUNCE=2
+WORKER_ARGS=""
+MAX_MEMORY=""
 for arg in "$@"; do
     case $arg in
-        build|convert|clean|help)
+        build|convert|watch|enqueue|worker|clean|help)
             COMMAND="$arg"
             ;;
         --dir=*)
@@ -48,12 +60,26 @@ for arg in "$@"; do
         --force)
             FORCE_REBUILD=true
             ;;
+        --debounce=*)
+            DEBOUNCE="${arg#*=}"
+            ;;
+        --drain)
+            WORKER_ARGS="--drain"
+            ;;
+        --max-memory=*)
+            MAX_MEMORY="${arg#*=}"
+            ;;
         *)
             # Unknown option
             ;;
     esac
 done
 
+MEMORY_ARGS=""
+if [ -n "$MAX_MEMORY" ]; then
+    MEMORY_ARGS="--max-memory=$MAX_MEMORY"
+fi
+
 # If no command provided, show help
 if [ -z "$COMMAND" ]; then
     show_help
@@ -75,19 +101,15 @@ case $COMMAND in
         fi
         
         # Create the directory structure if it doesn't exist
-        mkdir -p "$HOST_DIR"/{source,intermediate,processed/{low,medium,high},metadata,scripts}
+        mkdir -p "$HOST_DIR"/{source,intermediate,processed/{low,medium,high},metadata,queue,scripts}
         
         # Copy the scripts to the host directory if they exist in the current directory
-        if [ -f "$(dirname "$0")/scripts/convert_step_to_gltf.py" ]; then
-            cp "$(dirname "$0")/scripts/convert_step_to_gltf.py" "$HOST_DIR/scripts/"
-        fi
-        
         if [ -f "$(dirname "$0")/scripts/batch_convert.sh" ]; then
             cp "$(dirname "$0")/scripts/batch_convert.sh" "$HOST_DIR/scripts/"
         fi
         
-        if [ -f "$(dirname "$0")/scripts/convert_step.py" ]; then
-            cp "$(dirname "$0")/scripts/convert_step.py" "$HOST_DIR/scripts/"
+        if [ -d "$(dirname "$0")/extrusion_pipeline" ]; then
+            cp -r "$(dirname "$0")/extrusion_pipeline" "$HOST_DIR/"
         fi
         
         # Build the Docker image
@@ -127,7 +149,8 @@ case $COMMAND in
             -v "$HOST_DIR/processed:/app/processed" \
             -v "$HOST_DIR/metadata:/app/metadata" \
             -v "$HOST_DIR/scripts:/app/scripts" \
-            "$IMAGE_NAME"
+            -v "$HOST_DIR/extrusion_pipeline:/app/extrusion_pipeline" \
+            "$IMAGE_NAME" $MEMORY_ARGS
         
         if [ $? -eq 0 ]; then
             echo "✅ Conversion completed successfully"
@@ -140,6 +163,75 @@ case $COMMAND in
         fi
         ;;
         
+    watch)
+        echo "Watching $HOST_DIR/source for STEP files (Ctrl+C to stop)..."
+        
+        # Check if the image exists
+        if ! docker image inspect "$IMAGE_NAME" >/dev/null 2>&1; then
+            echo "❌ Docker image not found: $IMAGE_NAME"
+            echo "Build the image first: $0 build"
+            exit 1
+        fi
+        
+        # Run the container in the foreground until interrupted; only ask for a
+        # terminal when there is one, so this also works under systemd or nohup
+        TTY_ARGS=""
+        if [ -t 0 ]; then
+            TTY_ARGS="-it"
+        fi
+        docker run --rm $TTY_ARGS \
+            --name "$CONTAINER_NAME" \
+            -v "$HOST_DIR/source:/app/source" \
+            -v "$HOST_DIR/intermediate:/app/intermediate" \
+            -v "$HOST_DIR/processed:/app/processed" \
+            -v "$HOST_DIR/metadata:/app/metadata" \
+            -v "$HOST_DIR/scripts:/app/scripts" \
+            -v "$HOST_DIR/extrusion_pipeline:/app/extrusion_pipeline" \
+            --entrypoint python3 \
+            "$IMAGE_NAME" \
+            -m extrusion_pipeline --root /app watch --debounce="$DEBOUNCE" $MEMORY_ARGS
+        ;;
+        
+    enqueue|worker)
+        # Check if the image exists
+        if ! docker image inspect "$IMAGE_NAME" >/dev/null 2>&1; then
+            echo "❌ Docker image not found: $IMAGE_NAME"
+            echo "Build the image first: $0 build"
+            exit 1
+        fi
+        
+        mkdir -p "$HOST_DIR/queue"
+        if [ "$COMMAND" = "worker" ]; then
+            WORKER_ID="$(hostname)-$$"
+            echo "Starting worker $WORKER_ID on $HOST_DIR/queue..."
+            PIPELINE_ARGS="worker --worker-id=$WORKER_ID $WORKER_ARGS $MEMORY_ARGS"
+            RUN_NAME="$CONTAINER_NAME-$WORKER_ID"
+        else
+            echo "Queueing STEP files in $HOST_DIR/source..."
+            PIPELINE_ARGS="enqueue"
+            RUN_NAME="$CONTAINER_NAME-enqueue-$$"
+        fi
+        
+        # Every worker shares the same directories, typically on a network volume
+        docker run --rm \
+            --name "$RUN_NAME" \
+            -v "$HOST_DIR/source:/app/source" \
+            -v "$HOST_DIR/intermediate:/app/intermediate" \
+            -v "$HOST_DIR/processed:/app/processed" \
+            -v "$HOST_DIR/metadata:/app/metadata" \
+            -v "$HOST_DIR/queue:/app/queue" \
+            -v "$HOST_DIR/scripts:/app/scripts" \
+            -v "$HOST_DIR/extrusion_pipeline:/app/extrusion_pipeline" \
+            --entrypoint python3 \
+            "$IMAGE_NAME" \
+            -m extrusion_pipeline --root /app $PIPELINE_ARGS
+        
+        if [ $? -ne 0 ]; then
+            echo "❌ $COMMAND failed"
+            exit 1
+        fi
+        ;;
+        
     clean)
         echo "Cleaning up..."
         
@@ -0,0 +1,61 @@
+"""
+STEP to GLB conversion pipeline for extrusion models
+
+Runs entirely in one Python process: FreeCAD's modules load and tessellate the
+STEP file, numpy builds the LODs and normals, and the GLB is written directly.
+
+    from extrusion_pipeline import load_step, tessellate, build_lods, export_glb
+
+    mesh = tessellate(load_step('source/8020-1001.step'))
+    for lod, lod_mesh in build_lods(mesh).items():
+        export_glb(lod_mesh, f'processed/{lod}/8020-1001.glb')
+"""
+
+from .errors import PipelineError
+from .freecad import load_step, tessellate, tessellate_to_disk
+from .gltf import export_glb
+from .lod import build_lods, decimate
+from .manifest import SourceManifest
+from .memory import MemoryBudget, parse_size, peak_rss
+from .mesh import Mesh, orient_extrusion, read_obj, write_obj
+from .metadata import build_metadata, update_catalog, write_catalog, write_metadata
+from .normals import compute_normals
+from .outofcore import MappedMesh, MeshSpool, decimate_out_of_core
+from .pipeline import ConvertOptions, Workspace, convert_file, find_step_files, retire_model
+from .watch import Watcher
+from .workqueue import WorkQueue, Worker, enqueue_sources
+
+__all__ = [
+    'ConvertOptions',
+    'MappedMesh',
+    'MemoryBudget',
+    'Mesh',
+    'MeshSpool',
+    'PipelineError',
+    'SourceManifest',
+    'Watcher',
+    'WorkQueue',
+    'Worker',
+    'Workspace',
+    'build_lods',
+    'build_metadata',
+    'compute_normals',
+    'convert_file',
+    'decimate',
+    'decimate_out_of_core',
+    'enqueue_sources',
+    'export_glb',
+    'find_step_files',
+    'load_step',
+    'orient_extrusion',
+    'parse_size',
+    'peak_rss',
+    'read_obj',
+    'retire_model',
+    'tessellate',
+    'tessellate_to_disk',
+    'update_catalog',
+    'write_catalog',
+    'write_metadata',
+    'write_obj',
+]
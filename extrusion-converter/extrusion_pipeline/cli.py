@@ -0,0 +1,264 @@
+"""
+Command line interface
+
+Usage:
+    python3 -m extrusion_pipeline convert [STEP_FILE ...] [OPTIONS]
+    python3 -m extrusion_pipeline watch [--debounce=SECONDS] [OPTIONS]
+    python3 -m extrusion_pipeline enqueue [STEP_FILE ...] [--all]
+    python3 -m extrusion_pipeline worker [--drain] [OPTIONS]
+    python3 -m extrusion_pipeline status
+    python3 -m extrusion_pipeline catalog [--root=DIR]
+
+Without STEP files, ``convert`` processes everything in ``ROOT/source``. ``watch``
+keeps converting new or modified files in ``ROOT/source`` until interrupted.
+``enqueue`` queues new or modified files in ``ROOT/queue`` for any number of
+``worker`` processes sharing ``ROOT``, on one host or several.
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import time
+
+from .errors import PipelineError
+from .lod import LOD_RATIOS
+from .manifest import SourceManifest, fingerprint
+from .memory import MemoryBudget, format_size, parse_size, peak_rss
+from .metadata import UNIT_SCALES, update_catalog, write_catalog
+from .normals import DEFAULT_FEATURE_ANGLE
+from .pipeline import ConvertOptions, Workspace, convert_file, find_step_files, retire_model
+from .watch import DEFAULT_DEBOUNCE, Watcher
+from .workqueue import (DEFAULT_HEARTBEAT, DEFAULT_LEASE_TIMEOUT, DEFAULT_MAX_ATTEMPTS,
+                        DEFAULT_POLL_INTERVAL, WorkQueue, Worker, enqueue_sources)
+
+log = logging.getLogger('extrusion_pipeline')
+
+
+def _options_from_args(args) -> ConvertOptions:
+    return ConvertOptions(
+        lods=tuple(args.lod),
+        tolerance=args.tolerance,
+        unit=args.unit,
+        center=not args.no_center,
+        normalize=not args.no_normalize,
+        compress=not args.no_compress,
+        feature_angle=args.feature_angle,
+        keep_intermediate=args.keep_intermediate,
+        max_memory=args.max_memory,
+        keep_spool=args.keep_spool,
+    )
+
+
+def _memory_summary(options: ConvertOptions) -> str:
+    if options.max_memory:
+        return MemoryBudget(options.max_memory).report()
+    return f"Peak RSS: {format_size(peak_rss())} (no budget set)"
+
+
+def _check_budget(options: ConvertOptions) -> bool:
+    """Reject a --max-memory too small to run at all before doing any work."""
+    if options.max_memory:
+        try:
+            MemoryBudget(options.max_memory)
+        except PipelineError as e:
+            log.error("❌ %s", e)
+            return False
+    return True
+
+
+def cmd_convert(args) -> int:
+    workspace = Workspace(args.root)
+    options = _options_from_args(args)
+    if not _check_budget(options):
+        return 1
+
+    step_files = args.files or find_step_files(workspace.source_dir)
+    if not step_files:
+        log.error("No STEP files found in %s", workspace.source_dir)
+        return 1
+    log.info("Found %d STEP files to process.", len(step_files))
+
+    started = time.monotonic()
+    manifest = SourceManifest(workspace.manifest_path, workspace.source_dir)
+    failed, converted = [], {}
+    for count, step_path in enumerate(step_files, 1):
+        log.info("[%d/%d] Processing %s...", count, len(step_files), step_path)
+        try:
+            # Fingerprint first, so edits made during the conversion are picked up next run
+            source_fingerprint = fingerprint(step_path)
+            convert_file(step_path, workspace, options)
+        except Exception as e:
+            # One bad file must not cost the rest of the batch its catalog entries
+            log.error("  ❌ Failed to convert %s: %s", step_path, e,
+                      exc_info=not isinstance(e, PipelineError))
+            failed.append(step_path)
+            continue
+        converted[step_path] = source_fingerprint
+    manifest.update(recorded=converted)
+
+    models = write_catalog(workspace.metadata_dir, workspace.catalog_path)
+    log.info("Catalog generated at %s", workspace.catalog_path)
+    log.info("Summary:")
+    log.info("  - Models converted: %d/%d", len(step_files) - len(failed), len(step_files))
+    log.info("  - Models in catalog: %d", len(models))
+    log.info("  - Elapsed: %.1fs", time.monotonic() - started)
+    log.info("  - %s", _memory_summary(options))
+    return 1 if failed else 0
+
+
+def cmd_watch(args) -> int:
+    options = _options_from_args(args)
+    if not _check_budget(options):
+        return 1
+    watcher = Watcher(Workspace(args.root), options, debounce=args.debounce)
+    signal.signal(signal.SIGTERM, lambda *_: watcher.stop())
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    except PipelineError as e:
+        log.error("❌ %s", e)
+        return 1
+    log.info("Stopped watching")
+    return 0
+
+
+def cmd_enqueue(args) -> int:
+    workspace = Workspace(args.root)
+    queued = enqueue_sources(workspace, args.files or find_step_files(workspace.source_dir), force=args.all)
+    log.info("Queued %d jobs in %s", len(queued), WorkQueue(workspace).root)
+
+    if not args.files:
+        # Sources deleted since they were converted are retired right away
+        manifest = SourceManifest(workspace.manifest_path, workspace.source_dir)
+        missing = [(path, model_id) for path, model_id in manifest.items() if not os.path.exists(path)]
+        for _, model_id in missing:
+            retire_model(model_id, workspace)
+            log.info("Retired %s", model_id)
+        if missing:
+            manifest.update(forgotten=[path for path, _ in missing])
+            update_catalog(workspace.metadata_dir, workspace.catalog_path, [m for _, m in missing])
+    return 0
+
+
+def cmd_worker(args) -> int:
+    options = _options_from_args(args)
+    if not _check_budget(options):
+        return 1
+    try:
+        worker = Worker(Workspace(args.root), options, worker_id=args.worker_id,
+                        lease_timeout=args.lease_timeout, heartbeat=args.heartbeat,
+                        poll_interval=args.poll_interval, max_attempts=args.max_attempts)
+    except PipelineError as e:
+        log.error("❌ %s", e)
+        return 1
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+
+    started = time.monotonic()
+    try:
+        processed = worker.run(drain=args.drain)
+    except KeyboardInterrupt:
+        processed = worker.processed
+    log.info("Summary:")
+    log.info("  - Jobs completed by %s: %d", worker.worker_id, processed)
+    log.info("  - Elapsed: %.1fs", time.monotonic() - started)
+    log.info("  - %s", _memory_summary(options))
+    return 0
+
+
+def cmd_status(args) -> int:
+    queue = WorkQueue(Workspace(args.root))
+    for state, count in queue.status().items():
+        log.info("%-8s %d", state, count)
+    return 0
+
+
+def cmd_catalog(args) -> int:
+    workspace = Workspace(args.root)
+    models = write_catalog(workspace.metadata_dir, workspace.catalog_path)
+    log.info("Catalog generated at %s with %d models", workspace.catalog_path, len(models))
+    return 0
+
+
+def add_convert_options(parser: argparse.ArgumentParser) -> None:
+    """Options shared by every command that converts models."""
+    parser.add_argument('--lod', action='append', choices=list(LOD_RATIOS),
+                        help='Detail level to build; repeat for several (default: all)')
+    parser.add_argument('--tolerance', type=float, default=ConvertOptions.tolerance,
+                        help='Tessellation tolerance in model units')
+    parser.add_argument('--unit', choices=list(UNIT_SCALES), default=ConvertOptions.unit,
+                        help='Input unit')
+    parser.add_argument('--feature-angle', type=float, default=DEFAULT_FEATURE_ANGLE,
+                        help='Split vertex normals along edges sharper than this angle in degrees')
+    parser.add_argument('--no-center', action='store_true', help='Keep the original model position')
+    parser.add_argument('--no-normalize', action='store_true',
+                        help='Do not rotate the extrusion axis onto X')
+    parser.add_argument('--no-compress', action='store_true', help='Skip Draco compression')
+    parser.add_argument('--keep-intermediate', action='store_true',
+                        help='Keep the raw tessellation in intermediate/ as OBJ (not with --max-memory)')
+    parser.add_argument('--max-memory', type=parse_size, metavar='SIZE',
+                        help='Memory budget such as 2G; streams the mesh through memory-mapped '
+                             'chunks and decimates out-of-core to stay within it')
+    parser.add_argument('--keep-spool', action='store_true',
+                        help='With --max-memory, keep the memory-mapped tessellation in intermediate/ '
+                             '(can take several GB per model)')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='extrusion_pipeline',
+                                     description='Convert STEP extrusion models to GLB for the storefront')
+    parser.add_argument('--root', default='.', help='Directory containing source/, processed/ and metadata/')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only report errors')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser('convert', help='Convert STEP files')
+    convert.add_argument('files', nargs='*', help='STEP files (default: everything in ROOT/source)')
+    add_convert_options(convert)
+    convert.set_defaults(handler=cmd_convert)
+
+    watch = commands.add_parser('watch', help='Convert new or modified STEP files as they appear')
+    watch.add_argument('--debounce', type=float, default=DEFAULT_DEBOUNCE,
+                       help='Seconds without file events before a batch is converted')
+    add_convert_options(watch)
+    watch.set_defaults(handler=cmd_watch)
+
+    enqueue = commands.add_parser('enqueue', help='Queue new or modified STEP files for workers')
+    enqueue.add_argument('files', nargs='*', help='STEP files (default: everything in ROOT/source)')
+    enqueue.add_argument('--all', action='store_true', help='Queue files even if they are unchanged')
+    enqueue.set_defaults(handler=cmd_enqueue)
+
+    worker = commands.add_parser('worker', help='Convert queued jobs; run several against one ROOT')
+    worker.add_argument('--drain', action='store_true', help='Exit once the queue is empty')
+    worker.add_argument('--worker-id', help='Name used in leases and results (default: HOST-PID)')
+    worker.add_argument('--lease-timeout', type=float, default=DEFAULT_LEASE_TIMEOUT,
+                        help='Seconds without a heartbeat before a job is reclaimed from its worker')
+    worker.add_argument('--heartbeat', type=float, default=DEFAULT_HEARTBEAT,
+                        help='Seconds between lease heartbeats')
+    worker.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help='Seconds to wait before checking an empty queue again')
+    worker.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help='Give up on a job after this many failures')
+    add_convert_options(worker)
+    worker.set_defaults(handler=cmd_worker)
+
+    status = commands.add_parser('status', help='Show work queue counts')
+    status.set_defaults(handler=cmd_status)
+
+    catalog = commands.add_parser('catalog', help='Regenerate processed/catalog.json from metadata')
+    catalog.set_defaults(handler=cmd_catalog)
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, 'lod', None) is None:
+        args.lod = list(LOD_RATIOS)
+    logging.basicConfig(level=logging.ERROR if args.quiet else logging.INFO, format='%(message)s')
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+Exceptions raised by the conversion pipeline
+"""
+
+
+class PipelineError(Exception):
+    """A model could not be converted; the message says which stage failed."""
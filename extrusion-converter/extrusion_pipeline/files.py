@@ -0,0 +1,184 @@
+"""
+Filesystem helpers
+
+Every output is written to a unique temporary file next to its destination and
+renamed into place, so concurrent jobs never see (or clobber) half-written files.
+Lock and lease files rely only on ``O_EXCL`` creation and ``rename``, which are
+atomic on local filesystems and NFS alike, so several hosts can share a volume.
+Whether such a file is abandoned is decided without trusting other hosts' clocks.
+"""
+
+import json
+import logging
+import os
+import socket
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+from .errors import PipelineError
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TIMEOUT = 180.0
+DEFAULT_LOCK_STALE_AFTER = 120.0
+
+# Kept for the life of the process, so a long-running worker remembers locks
+# it has already been watching
+_lock_observers: Dict[float, 'StalenessObserver'] = {}
+
+
+@contextmanager
+def atomic_path(path: str):
+    """Yield a temporary path that replaces ``path`` when the block succeeds."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    name, extension = os.path.splitext(os.path.basename(path))
+    # Keep the extension: some tools pick the output format from it
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + name + '.', suffix=extension, dir=directory)
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def write_json(data, path: str) -> None:
+    """Atomically write ``data`` as indented JSON."""
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.write('\n')
+
+
+def read_json(path: str, default=None):
+    """Read a JSON file, returning ``default`` if it does not exist."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def create_exclusive(path: str, data) -> bool:
+    """Create ``path`` holding ``data`` as JSON unless it already exists."""
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f)
+    return True
+
+
+class StalenessObserver:
+    """Judges lease and lock files stale by watching their mtime locally.
+
+    A file's mtime on a shared volume comes from the file server or another
+    host, so comparing it with this host's clock breaks as soon as the clocks
+    drift apart. Instead the mtime is only compared with itself: a file is
+    stale once it has kept the same mtime for ``stale_after`` seconds of this
+    process's monotonic clock. The first sighting of a file therefore always
+    counts as fresh.
+    """
+
+    def __init__(self, stale_after: float):
+        self.stale_after = stale_after
+        self._seen: Dict[str, Tuple[int, float]] = {}
+
+    def mtime(self, path: str) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def is_stale(self, path: str) -> bool:
+        mtime = self.mtime(path)
+        if mtime is None:
+            self._seen.pop(path, None)
+            return False
+        now = time.monotonic()
+        seen = self._seen.get(path)
+        if seen is None or seen[0] != mtime:
+            self._seen[path] = (mtime, now)
+            return False
+        return now - seen[1] >= self.stale_after
+
+    def forget(self, path: str) -> None:
+        self._seen.pop(path, None)
+
+
+def break_stale(path: str, observer: StalenessObserver) -> bool:
+    """Remove ``path`` if ``observer`` has seen it untouched for long enough.
+
+    The file is first renamed to a unique name so that only one of several
+    competing processes removes it; if it turns out to have been refreshed in
+    the meantime it is put back. Returns True if the file was removed, False
+    if it is fresh, gone, or could not be renamed.
+    """
+    if not observer.is_stale(path):
+        return False
+    observed = observer.mtime(path)
+
+    stolen = f"{path}.stale.{uuid.uuid4().hex}"
+    try:
+        os.rename(path, stolen)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        log.warning("Cannot break stale file %s: %s", path, e)
+        return False
+    observer.forget(path)
+
+    if observer.mtime(stolen) != observed:
+        # Refreshed between the check and the rename: put it back unless
+        # someone has already created a new one. Only rename is used, as many
+        # shared volumes (SMB, some NFS and FUSE mounts) lack hard links.
+        try:
+            if os.path.exists(path):
+                os.unlink(stolen)
+            else:
+                os.rename(stolen, path)
+        except OSError as e:
+            log.warning("Cannot restore refreshed file %s: %s", path, e)
+        return False
+
+    try:
+        os.unlink(stolen)
+    except FileNotFoundError:
+        pass
+    return True
+
+
+def owner_info():
+    return {"host": socket.gethostname(), "pid": os.getpid(), "created_at": time.time()}
+
+
+@contextmanager
+def file_lock(path: str, timeout: float = DEFAULT_LOCK_TIMEOUT,
+              stale_after: float = DEFAULT_LOCK_STALE_AFTER):
+    """Hold an exclusive lock file for the duration of the block.
+
+    Locks left behind by crashed processes are broken once this process has
+    seen them unchanged for ``stale_after`` seconds (see
+    :class:`StalenessObserver`), so ``timeout`` must be longer than that.
+    """
+    observer = _lock_observers.setdefault(stale_after, StalenessObserver(stale_after))
+    deadline = time.monotonic() + timeout
+    while not create_exclusive(path, owner_info()):
+        if break_stale(path, observer):
+            continue
+        if time.monotonic() > deadline:
+            raise PipelineError(f"Timed out waiting for lock {path}")
+        time.sleep(0.05)
+    try:
+        yield
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,104 @@
+"""
+In-process STEP loading and tessellation through FreeCAD's Python modules
+
+FreeCAD is imported once per process instead of launching a FreeCAD interpreter
+for every file. The Ubuntu package installs its modules outside ``sys.path``, so
+the library directory is located from ``FREECAD_LIB`` or the usual install paths.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+from .errors import PipelineError
+from .mesh import Mesh
+from .outofcore import MappedMesh, MeshSpool
+
+FREECAD_LIB_PATHS = [
+    '/usr/lib/freecad-python3/lib',
+    '/usr/lib/freecad/lib',
+    '/usr/local/lib/freecad/lib',
+    '/usr/share/freecad/lib',
+]
+
+DEFAULT_TOLERANCE = 0.1
+
+_part = None
+
+
+def _import_part():
+    """Import FreeCAD's ``Part`` module, extending ``sys.path`` if needed."""
+    global _part
+    if _part is not None:
+        return _part
+
+    candidates = [os.environ.get('FREECAD_LIB')] + FREECAD_LIB_PATHS
+    for path in candidates:
+        if path and os.path.isdir(path) and path not in sys.path:
+            sys.path.append(path)
+
+    try:
+        import FreeCAD  # noqa: F401  (initialises the application)
+        import Part
+    except ImportError as e:
+        raise PipelineError(
+            f"FreeCAD Python modules not found ({e}); set FREECAD_LIB to the directory containing FreeCAD.so"
+        ) from e
+
+    _part = Part
+    return _part
+
+
+def load_step(path: str):
+    """Read a STEP file into a FreeCAD ``Part.Shape``."""
+    if not os.path.exists(path):
+        raise PipelineError(f"Input file not found: {path}")
+
+    Part = _import_part()
+    shape = Part.Shape()
+    try:
+        shape.read(path)
+    except Exception as e:
+        raise PipelineError(f"Error reading STEP file {path}: {e}") from e
+
+    if shape.isNull() or not shape.Faces:
+        raise PipelineError(f"STEP file contains no surfaces: {path}")
+    return shape
+
+
+def tessellate(shape, tolerance: float = DEFAULT_TOLERANCE) -> Mesh:
+    """Triangulate a shape with the given linear deflection tolerance."""
+    try:
+        points, facets = shape.tessellate(tolerance)
+    except Exception as e:
+        raise PipelineError(f"Tessellation failed: {e}") from e
+    if not facets:
+        raise PipelineError("Tessellation produced no triangles")
+
+    vertices = np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+    faces = np.array(facets, dtype=np.int64).reshape(-1, 3)
+    return Mesh(vertices, faces)
+
+
+def tessellate_to_disk(shape, base_path: str, tolerance: float = DEFAULT_TOLERANCE) -> MappedMesh:
+    """Triangulate a shape face by face, spooling the triangles to disk.
+
+    Only one B-rep face's triangulation is held in Python objects at a time;
+    the result is returned memory-mapped. Vertices on shared edges are
+    duplicated per face and welded later by the out-of-core decimation.
+    """
+    spool = MeshSpool(base_path)
+    try:
+        for index, face in enumerate(shape.Faces):
+            try:
+                points, facets = face.tessellate(tolerance)
+            except Exception as e:
+                raise PipelineError(f"Tessellation of face {index} failed: {e}") from e
+            if facets:
+                spool.append(np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64),
+                             np.array(facets, dtype=np.int64).reshape(-1, 3))
+    except Exception:
+        spool.discard()
+        raise
+    return spool.close()
@@ -0,0 +1,181 @@
+"""
+Binary glTF (GLB) export
+
+Writes a single-mesh GLB with positions, normals, triangle indices and an aluminum
+PBR material. Meshes are converted from the Z-up frame set up by
+:func:`mesh.extrusion_orientation` to glTF's Y-up frame.
+The binary chunk is streamed to disk in slices, converting each slice to its
+output type on the way, so no second copy of the buffers is built in memory.
+Draco compression is delegated to ``gltf-pipeline`` when requested.
+"""
+
+import json
+import logging
+import os
+import shutil
+import struct
+import subprocess
+
+import numpy as np
+
+from .errors import PipelineError
+from .files import atomic_path
+from .mesh import Mesh
+
+log = logging.getLogger(__name__)
+
+GLB_MAGIC = 0x46546C67  # "glTF"
+GLB_VERSION = 2
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+FLOAT = 5126
+UNSIGNED_SHORT = 5123
+UNSIGNED_INT = 5125
+TRIANGLES = 4
+
+DRACO_COMPRESSION_LEVEL = 6
+STREAM_ROWS = 65536
+
+ALUMINUM_MATERIAL = {
+    "name": "Aluminum",
+    "pbrMetallicRoughness": {
+        "baseColorFactor": [0.91, 0.91, 0.91, 1.0],
+        "metallicFactor": 0.9,
+        "roughnessFactor": 0.2,
+    },
+}
+
+# Z-up (X right, Y back, Z up) to glTF (X right, Y up, Z front)
+Z_UP_TO_Y_UP = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, -1.0, 0.0]])
+
+
+def _pad(data: bytes, fill: bytes) -> bytes:
+    return data + fill * (-len(data) % 4)
+
+
+def _padding(length: int) -> int:
+    return -length % 4
+
+
+def _slices(array: np.ndarray, rows: int = STREAM_ROWS):
+    for start in range(0, len(array), rows):
+        yield array[start:start + rows]
+
+
+def _y_up(array: np.ndarray) -> np.ndarray:
+    return array @ Z_UP_TO_Y_UP.T
+
+
+def build_gltf_document(mesh: Mesh, name: str):
+    """Return ``(document, views)`` for a single mesh.
+
+    ``views`` lists ``(array, dtype, convert)`` for each buffer view in BIN
+    chunk order; :func:`write_glb` converts and writes them slice by slice.
+    """
+    if mesh.normals is None:
+        raise PipelineError("Mesh has no normals; run compute_normals before export")
+
+    index_dtype, index_type = ('<u2', UNSIGNED_SHORT) if mesh.vertex_count <= 0xFFFF else ('<u4', UNSIGNED_INT)
+    views = [
+        (mesh.vertices, '<f4', _y_up),
+        (mesh.normals, '<f4', _y_up),
+        (mesh.faces, index_dtype, None),
+    ]
+    targets = [ARRAY_BUFFER, ARRAY_BUFFER, ELEMENT_ARRAY_BUFFER]
+
+    buffer_views = []
+    offset = 0
+    for (array, dtype, _), target in zip(views, targets):
+        length = array.size * np.dtype(dtype).itemsize
+        buffer_views.append({"buffer": 0, "byteOffset": offset, "byteLength": length, "target": target})
+        offset += length + _padding(length)
+
+    position_min = np.full(3, np.inf)
+    position_max = np.full(3, -np.inf)
+    for chunk in _slices(mesh.vertices):
+        positions = _y_up(chunk)
+        position_min = np.minimum(position_min, positions.min(axis=0))
+        position_max = np.maximum(position_max, positions.max(axis=0))
+    if not mesh.vertex_count:
+        position_min = position_max = np.zeros(3)
+
+    document = {
+        "asset": {"version": "2.0", "generator": "extrusion_pipeline"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "name": name}],
+        "meshes": [{
+            "name": name,
+            "primitives": [{
+                "attributes": {"POSITION": 0, "NORMAL": 1},
+                "indices": 2,
+                "material": 0,
+                "mode": TRIANGLES,
+            }],
+        }],
+        "materials": [ALUMINUM_MATERIAL],
+        "buffers": [{"byteLength": offset}],
+        "bufferViews": buffer_views,
+        "accessors": [
+            {
+                "bufferView": 0, "componentType": FLOAT, "count": mesh.vertex_count, "type": "VEC3",
+                # Bounds of the float32 values actually written
+                "min": position_min.astype('<f4').tolist(),
+                "max": position_max.astype('<f4').tolist(),
+            },
+            {"bufferView": 1, "componentType": FLOAT, "count": mesh.vertex_count, "type": "VEC3"},
+            {"bufferView": 2, "componentType": index_type, "count": mesh.faces.size, "type": "SCALAR"},
+        ],
+    }
+    return document, views
+
+
+def write_glb(document, views, path: str) -> None:
+    """Write a GLB container, streaming the BIN chunk from ``views``."""
+    json_chunk = _pad(json.dumps(document, separators=(',', ':')).encode('utf-8'), b' ')
+    bin_length = document["buffers"][0]["byteLength"]
+    total = 12 + 8 + len(json_chunk) + 8 + bin_length
+
+    with atomic_path(path) as tmp_path, open(tmp_path, 'wb') as f:
+        f.write(struct.pack('<III', GLB_MAGIC, GLB_VERSION, total))
+        f.write(struct.pack('<II', len(json_chunk), CHUNK_JSON))
+        f.write(json_chunk)
+        f.write(struct.pack('<II', bin_length, CHUNK_BIN))
+        for array, dtype, convert in views:
+            written = 0
+            for chunk in _slices(array):
+                if convert is not None:
+                    chunk = convert(chunk)
+                data = np.ascontiguousarray(chunk, dtype=dtype)
+                f.write(data.data)
+                written += data.nbytes
+            f.write(b'\x00' * _padding(written))
+
+
+def draco_compress(path: str) -> bool:
+    """Compress a GLB in place with ``gltf-pipeline``; returns False if unavailable."""
+    tool = shutil.which('gltf-pipeline')
+    if tool is None:
+        log.warning("gltf-pipeline not found, leaving %s uncompressed", path)
+        return False
+
+    with atomic_path(path) as tmp_path:
+        result = subprocess.run(
+            [tool, '-i', path, '-o', tmp_path, '-d',
+             '--draco.compressionLevel', str(DRACO_COMPRESSION_LEVEL)],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            raise PipelineError(f"Draco compression failed for {path}: {result.stderr.strip()}")
+    return True
+
+
+def export_glb(mesh: Mesh, path: str, name: str = 'Extrusion', compress: bool = False) -> int:
+    """Export ``mesh`` to ``path`` and return the resulting file size in bytes."""
+    document, views = build_gltf_document(mesh, name)
+    write_glb(document, views, path)
+    if compress:
+        draco_compress(path)
+    return os.path.getsize(path)
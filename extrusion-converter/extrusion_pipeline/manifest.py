@@ -0,0 +1,78 @@
+"""
+Record of which source files have been converted, and in which state
+
+Lets incremental runs tell new or modified STEP files from unchanged ones, and
+find models whose source has disappeared.
+"""
+
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+from .files import file_lock, read_json, write_json
+from .mesh import model_id_for
+
+
+def fingerprint(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+class SourceManifest:
+    """Maps source paths (relative to the source directory) to their fingerprint."""
+
+    def __init__(self, path: str, source_dir: str):
+        self.path = path
+        self.source_dir = source_dir
+        self.entries = read_json(path, default={}).get("sources", {})
+
+    def _key(self, source_path: str) -> str:
+        return os.path.relpath(os.path.abspath(source_path), os.path.abspath(self.source_dir))
+
+    def changed(self, source_path: str) -> bool:
+        """True if the file is new or differs from when it was last converted."""
+        entry = self.entries.get(self._key(source_path))
+        if entry is None:
+            return True
+        try:
+            current = fingerprint(source_path)
+        except FileNotFoundError:
+            return True
+        return entry["mtime_ns"] != current["mtime_ns"] or entry["size"] != current["size"]
+
+    def record(self, source_path: str, source_fingerprint: Dict[str, int]) -> None:
+        """Mark a file as converted in the state given by ``source_fingerprint``.
+
+        Take the fingerprint before converting: if the file changes while it is
+        being converted, it then still shows up as changed afterwards.
+        """
+        entry = dict(source_fingerprint, model_id=model_id_for(source_path))
+        self.entries[self._key(source_path)] = entry
+
+    def forget(self, source_path: str) -> None:
+        self.entries.pop(self._key(source_path), None)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Yield ``(source_path, model_id)`` for every recorded file."""
+        for key, entry in list(self.entries.items()):
+            yield os.path.join(self.source_dir, key), entry["model_id"]
+
+    def save(self) -> None:
+        write_json({"sources": self.entries}, self.path)
+
+    def update(self, recorded: Optional[Dict[str, Dict[str, int]]] = None, forgotten=()) -> None:
+        """Merge changes into the manifest on disk under a lock.
+
+        ``recorded`` maps converted source paths to their fingerprint from
+        before the conversion; files that have disappeared since are skipped
+        and left to be retired. Use this instead of :meth:`save` when other
+        processes may be updating the same manifest concurrently.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with file_lock(self.path + '.lock'):
+            self.entries = read_json(self.path, default={}).get("sources", {})
+            for source_path, source_fingerprint in (recorded or {}).items():
+                if os.path.exists(source_path):
+                    self.record(source_path, source_fingerprint)
+            for source_path in forgotten:
+                self.forget(source_path)
+            self.save()
@@ -0,0 +1,83 @@
+"""
+Memory budget accounting for ``--max-memory``
+
+The budget is split between the chunks streamed through the out-of-core stages
+and the final in-memory LOD meshes, whose normals and export need the whole mesh.
+The per-face costs below were measured on large tessellations with tracemalloc
+and rounded up.
+"""
+
+import re
+import resource
+from dataclasses import dataclass
+
+from .errors import PipelineError
+
+# Peak bytes per triangle of a chunk in the clustering pass (positions, keys, quadrics)
+CHUNK_BYTES_PER_FACE = 1024
+# Peak bytes per triangle of compute_normals plus GLB export on a resident mesh
+RESIDENT_BYTES_PER_FACE = 1024
+# Share of the budget the streamed chunks may use; the rest holds the LOD output
+CHUNK_SHARE = 0.25
+# Memory assumed taken by the interpreter, numpy, scipy and FreeCAD themselves
+BASELINE_BYTES = 256 * 1024 * 1024
+
+MIN_CHUNK_FACES = 10000
+MAX_CHUNK_FACES = 2000000
+
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte size such as ``512M``, ``2G`` or ``1.5GiB``."""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*', text, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size: {text!r} (expected e.g. 512M or 2G)")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size: float) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024.0
+
+
+def peak_rss() -> int:
+    """Peak resident set size in bytes of this process or any child it waited for."""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) * 1024  # Linux reports kilobytes
+
+
+@dataclass
+class MemoryBudget:
+    """Sizes derived from a byte budget for the out-of-core pipeline."""
+    max_bytes: int
+
+    def __post_init__(self):
+        if self.max_bytes <= BASELINE_BYTES:
+            raise PipelineError(
+                f"--max-memory must be larger than {format_size(BASELINE_BYTES)} "
+                "for the interpreter and FreeCAD themselves")
+
+    @property
+    def usable_bytes(self) -> int:
+        return self.max_bytes - BASELINE_BYTES
+
+    @property
+    def chunk_faces(self) -> int:
+        """Triangles processed per streamed chunk."""
+        faces = int(self.usable_bytes * CHUNK_SHARE / CHUNK_BYTES_PER_FACE)
+        return max(MIN_CHUNK_FACES, min(MAX_CHUNK_FACES, faces))
+
+    @property
+    def max_resident_faces(self) -> int:
+        """Largest LOD mesh that may be held in memory for normals and export."""
+        return int(self.usable_bytes * (1.0 - CHUNK_SHARE) / RESIDENT_BYTES_PER_FACE)
+
+    def report(self) -> str:
+        peak = peak_rss()
+        status = "within" if peak <= self.max_bytes else "OVER"
+        return (f"Peak RSS: {format_size(peak)} of {format_size(self.max_bytes)} budget "
+                f"({100.0 * peak / self.max_bytes:.0f}%, {status} budget)")
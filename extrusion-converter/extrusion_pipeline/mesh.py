@@ -0,0 +1,153 @@
+"""
+In-memory triangle mesh plus OBJ I/O and extrusion orientation helpers
+"""
+
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from .files import atomic_path
+
+AXIS_NAMES = ['x', 'y', 'z']
+
+# FreeCAD tessellations used to reach Blender through OBJ, which it imports as
+# Y-up (X right, Y up, Z front) into its own Z-up frame. The extrusion axis,
+# the metadata dimensions and the GLB are all worked out in that frame, so the
+# storefront sees the same width, height and cross-section as before.
+Y_UP_TO_Z_UP = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]])
+
+
+@dataclass
+class Mesh:
+    """Triangle mesh with optional per-vertex normals."""
+    vertices: np.ndarray
+    faces: np.ndarray
+    normals: Optional[np.ndarray] = None
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.faces)
+
+    def bounds(self):
+        """Return ``(min, max)`` corners of the axis-aligned bounding box."""
+        if self.vertex_count == 0:
+            zero = np.zeros(3)
+            return zero, zero
+        return self.vertices.min(axis=0), self.vertices.max(axis=0)
+
+
+@dataclass
+class Orientation:
+    """Where a mesh came from before :func:`orient_extrusion` moved it."""
+    bbox_min: List[float]
+    bbox_max: List[float]
+    center: List[float]
+    dimensions: List[float]
+    extrusion_axis: str
+
+
+def read_obj(path: str) -> Mesh:
+    """Read vertex positions and triangle indices from an OBJ file.
+
+    Normals and texture coordinates in the input are ignored; polygons with more
+    than three corners are fan-triangulated.
+    """
+    vertices = []
+    faces = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('v '):
+                vertices.append([float(x) for x in line.split()[1:4]])
+            elif line.startswith('f '):
+                corners = [int(token.split('/')[0]) for token in line.split()[1:]]
+                for i in range(1, len(corners) - 1):
+                    faces.append([corners[0], corners[i], corners[i + 1]])
+
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    # OBJ indices are 1-based, negative indices are relative to the end
+    faces = np.where(faces > 0, faces - 1, faces + len(vertices))
+    return Mesh(vertices, faces)
+
+
+def write_obj(mesh: Mesh, path: str) -> None:
+    """Write an OBJ file, with one normal per vertex (``f v//vn``) if present."""
+    indices = mesh.faces + 1
+    with atomic_path(path) as tmp_path, open(tmp_path, 'w') as f:
+        f.write("# Created by extrusion_pipeline\n")
+        np.savetxt(f, mesh.vertices, fmt='v %.6f %.6f %.6f')
+        if mesh.normals is not None:
+            np.savetxt(f, mesh.normals, fmt='vn %.6f %.6f %.6f')
+            np.savetxt(f, np.repeat(indices, 2, axis=1), fmt='f %d//%d %d//%d %d//%d')
+        else:
+            np.savetxt(f, indices, fmt='f %d %d %d')
+
+
+def extrusion_orientation(bbox_min: np.ndarray, bbox_max: np.ndarray,
+                          center: bool = True, normalize: bool = True):
+    """Work out how to center a model and rotate its longest axis onto X.
+
+    The longest bounding-box dimension is assumed to be the extrusion axis, so
+    the storefront can stretch the model along X to any cut length. The box
+    is given in FreeCAD coordinates; the orientation and the rotation are in
+    the Z-up frame of :data:`Y_UP_TO_Z_UP`.
+
+    Returns ``(orientation, translation, rotation)``; apply the last two with
+    :func:`transform_mesh`.
+    """
+    translation = -(bbox_min + bbox_max) / 2.0 if center else np.zeros(3)
+
+    corners = np.stack([bbox_min, bbox_max]) @ Y_UP_TO_Z_UP.T
+    bbox_min, bbox_max = corners.min(axis=0), corners.max(axis=0)
+    bbox_center = (bbox_min + bbox_max) / 2.0
+    dimensions = bbox_max - bbox_min
+    extrusion_axis = int(np.argmax(dimensions))
+
+    rotation = np.eye(3)
+    if normalize and extrusion_axis != 0:
+        # Quarter turn about Z (Y longest) or Y (Z longest)
+        if extrusion_axis == 1:
+            rotation = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        else:
+            rotation = np.array([[0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]])
+        dimensions = np.abs(rotation) @ dimensions
+        extrusion_axis = 0
+    rotation = rotation @ Y_UP_TO_Z_UP
+
+    orientation = Orientation(
+        bbox_min=bbox_min.tolist(),
+        bbox_max=bbox_max.tolist(),
+        center=bbox_center.tolist(),
+        dimensions=dimensions.tolist(),
+        extrusion_axis=AXIS_NAMES[extrusion_axis],
+    )
+    return orientation, translation, rotation
+
+
+def transform_mesh(mesh: Mesh, translation: np.ndarray, rotation: np.ndarray) -> Mesh:
+    """Translate, then rotate a mesh (normals are only rotated)."""
+    vertices = (mesh.vertices + translation) @ rotation.T
+    normals = mesh.normals @ rotation.T if mesh.normals is not None else None
+    return Mesh(vertices, mesh.faces, normals)
+
+
+def orient_extrusion(mesh: Mesh, center: bool = True, normalize: bool = True):
+    """Move the mesh into the Z-up frame, centered with its longest axis on X.
+
+    Returns ``(mesh, orientation)`` where ``orientation`` records the bounding
+    box and center before normalization and the dimensions after it.
+    """
+    bbox_min, bbox_max = mesh.bounds()
+    orientation, translation, rotation = extrusion_orientation(bbox_min, bbox_max, center, normalize)
+    return transform_mesh(mesh, translation, rotation), orientation
+
+
+def model_id_for(path: str) -> str:
+    """Model ID used for output file names: the STEP file name without extension."""
+    return os.path.splitext(os.path.basename(path))[0]
@@ -0,0 +1,108 @@
+"""
+Per-LOD model metadata and the storefront catalog
+"""
+
+import glob
+import os
+from typing import Dict, Iterable, List
+
+from .files import file_lock, read_json, write_json
+from .mesh import Orientation
+
+UNIT_SCALES = {
+    'inch': 1.0,
+    'mm': 0.0393701,  # mm to inch
+}
+
+# LOD whose metadata represents a model in the catalog, in order of preference
+CATALOG_LOD_PREFERENCE = ['medium', 'high', 'low']
+
+
+def build_metadata(model_id: str, orientation: Orientation, lod: str,
+                   model_file: str, file_size: int, unit: str = 'inch') -> Dict:
+    """Describe one exported LOD of a model for the storefront."""
+    scale = UNIT_SCALES[unit]
+    width, height, length = orientation.dimensions[1], orientation.dimensions[2], orientation.dimensions[0]
+    return {
+        "id": model_id,
+        "name": model_id.replace('-', ' ').title(),
+        "profileType": "custom",  # Can be refined based on analysis
+        "dimensions": {
+            "width": width * scale,
+            "height": height * scale,
+            "baseLength": length * scale,
+        },
+        "boundingBox": {
+            "min": [value * scale for value in orientation.bbox_min],
+            "max": [value * scale for value in orientation.bbox_max],
+        },
+        "center": [value * scale for value in orientation.center],
+        "extrusionAxis": orientation.extrusion_axis,
+        "material": "aluminum",
+        "supportsTapping": True,
+        "modelFile": model_file,
+        "lod": lod,
+        "fileSize": file_size,
+    }
+
+
+def metadata_path(metadata_dir: str, model_id: str, lod: str) -> str:
+    return os.path.join(metadata_dir, f"{model_id}_{lod}.json")
+
+
+def write_metadata(metadata: Dict, path: str) -> None:
+    """Atomically write one metadata file."""
+    write_json(metadata, path)
+
+
+def catalog_entry(metadata_dir: str, model_id: str):
+    """Metadata of the preferred LOD of a model, or None if it has none."""
+    for lod in CATALOG_LOD_PREFERENCE:
+        metadata = read_json(metadata_path(metadata_dir, model_id, lod))
+        if metadata is not None:
+            return metadata
+    return None
+
+
+def list_model_ids(metadata_dir: str) -> List[str]:
+    """Model IDs that have at least one metadata file."""
+    model_ids = set()
+    for path in glob.glob(os.path.join(metadata_dir, '*_*.json')):
+        model_id, lod = os.path.splitext(os.path.basename(path))[0].rsplit('_', 1)
+        if lod in CATALOG_LOD_PREFERENCE:
+            model_ids.add(model_id)
+    return sorted(model_ids)
+
+
+def write_catalog(metadata_dir: str, catalog_path: str) -> List[Dict]:
+    """Regenerate the catalog from every model's metadata and return its entries."""
+    os.makedirs(os.path.dirname(os.path.abspath(catalog_path)), exist_ok=True)
+    with file_lock(catalog_path + '.lock'):
+        models = []
+        for model_id in list_model_ids(metadata_dir):
+            entry = catalog_entry(metadata_dir, model_id)
+            if entry is not None:
+                models.append(entry)
+        write_json({"models": models}, catalog_path)
+    return models
+
+
+def update_catalog(metadata_dir: str, catalog_path: str, model_ids: Iterable[str]) -> List[Dict]:
+    """Refresh only the given models' catalog entries, dropping retired ones.
+
+    The read-modify-write runs under a lock file, so workers on several hosts
+    can merge their results into one catalog.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(catalog_path)), exist_ok=True)
+    with file_lock(catalog_path + '.lock'):
+        catalog = read_json(catalog_path, default={"models": []})
+        entries = {entry["id"]: entry for entry in catalog.get("models", [])}
+        for model_id in model_ids:
+            entry = catalog_entry(metadata_dir, model_id)
+            if entry is None:
+                entries.pop(model_id, None)
+            else:
+                entries[model_id] = entry
+        models = [entries[model_id] for model_id in sorted(entries)]
+        write_json({"models": models}, catalog_path)
+    return models
@@ -0,0 +1,96 @@
+"""
+Feature-angle vertex normal generation for tessellated extrusion meshes
+
+FreeCAD produces bare triangles (one flat normal per facet). This module computes
+area-weighted vertex normals and only splits vertices along edges sharper than a
+feature angle, so fillets and slot radii shade smoothly while flat faces and hard
+corners stay crisp, with far fewer vertices than per-face normals.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+DEFAULT_FEATURE_ANGLE = 30.0
+
+
+def compute_normals(vertices: np.ndarray, faces: np.ndarray,
+                    feature_angle: float = DEFAULT_FEATURE_ANGLE
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute area-weighted vertex normals, splitting along sharp edges.
+
+    Every face corner starts out as its own vertex. Corners that share a
+    position are merged whenever they can be reached from each other across
+    edges whose dihedral angle is at most ``feature_angle`` degrees, so a
+    vertex is duplicated only once per smooth region that touches it.
+
+    Returns a tuple ``(vertices, normals, faces)`` describing the split mesh.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    face_count = len(faces)
+    if face_count == 0:
+        return vertices[:0], vertices[:0], faces
+
+    # Face normals; the cross product length is twice the area, which gives
+    # the area weighting for free when the normals are summed.
+    tri = vertices[faces]
+    weighted = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    lengths = np.linalg.norm(weighted, axis=1)
+    degenerate = lengths <= np.finfo(np.float64).eps
+    unit = weighted / np.where(degenerate, 1.0, lengths)[:, None]
+
+    # Half-edges: corner k of face i runs to corner (k + 1) % 3
+    corner_ids = np.arange(face_count * 3).reshape(-1, 3)
+    start_corner = corner_ids.ravel()
+    end_corner = corner_ids[:, [1, 2, 0]].ravel()
+    start_vertex = faces.ravel()
+    end_vertex = faces[:, [1, 2, 0]].ravel()
+    edge_face = np.repeat(np.arange(face_count), 3)
+
+    # Orient each half-edge by vertex index so both sides of an edge share a key
+    swap = start_vertex > end_vertex
+    lo_vertex = np.where(swap, end_vertex, start_vertex)
+    hi_vertex = np.where(swap, start_vertex, end_vertex)
+    lo_corner = np.where(swap, end_corner, start_corner)
+    hi_corner = np.where(swap, start_corner, end_corner)
+
+    order = np.lexsort((hi_vertex, lo_vertex))
+    keys = np.stack([lo_vertex[order], hi_vertex[order]], axis=1)
+    _, group_start, group_size = np.unique(keys, axis=0, return_index=True, return_counts=True)
+
+    # Only manifold edges (exactly two faces) can be smooth; boundary and
+    # non-manifold edges always split.
+    manifold = group_start[group_size == 2]
+    a = order[manifold]
+    b = order[manifold + 1]
+    face_a = edge_face[a]
+    face_b = edge_face[b]
+
+    cos_limit = np.cos(np.radians(feature_angle))
+    dots = np.einsum('ij,ij->i', unit[face_a], unit[face_b])
+    smooth = (dots >= cos_limit) | degenerate[face_a] | degenerate[face_b]
+
+    a = a[smooth]
+    b = b[smooth]
+    rows = np.concatenate([lo_corner[a], hi_corner[a]])
+    cols = np.concatenate([lo_corner[b], hi_corner[b]])
+    corner_count = face_count * 3
+    graph = coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)),
+                       shape=(corner_count, corner_count))
+    _, labels = connected_components(graph, directed=False)
+
+    # Each connected group of corners becomes one output vertex
+    _, first_corner, new_index = np.unique(labels, return_index=True, return_inverse=True)
+    out_vertices = vertices[start_vertex[first_corner]]
+
+    out_normals = np.zeros((len(first_corner), 3), dtype=np.float64)
+    np.add.at(out_normals, new_index, np.repeat(weighted, 3, axis=0))
+    norms = np.linalg.norm(out_normals, axis=1)
+    flat = norms <= np.finfo(np.float64).eps
+    out_normals = out_normals / np.where(flat, 1.0, norms)[:, None]
+    out_normals[flat] = (0.0, 0.0, 1.0)
+
+    return out_vertices, out_normals, new_index.reshape(-1, 3)
@@ -0,0 +1,252 @@
+"""
+Out-of-core mesh storage and decimation for models larger than the memory budget
+
+Tessellated triangles are spooled to raw little-endian files in intermediate/ and
+read back through ``numpy.memmap`` in fixed-size chunks, so only one chunk of the
+full-resolution mesh is resident at a time. Decimation uses the same quadric
+vertex clustering as :mod:`lod`, but accumulates each spatial cluster's quadric,
+vertex sum and bounds chunk by chunk keyed by its packed grid cell, so memory
+grows with the size of the output rather than the input.
+"""
+
+import logging
+import os
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from .errors import PipelineError
+from .lod import cell_keys, solve_cluster_positions, triangle_quadrics
+from .mesh import Mesh
+
+log = logging.getLogger(__name__)
+
+# Grid used to weld coincident vertices of neighbouring B-rep faces, relative
+# to the bounding-box diagonal; must stay above 1 / lod.MAX_CELLS
+WELD_RESOLUTION = 1e-6
+SEARCH_PASSES = 12
+
+
+class MappedMesh:
+    """Triangle mesh whose arrays are memory-mapped from the intermediate files."""
+
+    def __init__(self, vertices_path: str, faces_path: str):
+        self.vertices_path = vertices_path
+        self.faces_path = faces_path
+        if os.path.getsize(faces_path) == 0:
+            raise PipelineError("Tessellation produced no triangles")
+        self.vertices = np.memmap(vertices_path, dtype='<f8', mode='r').reshape(-1, 3)
+        self.faces = np.memmap(faces_path, dtype='<i8', mode='r').reshape(-1, 3)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.faces)
+
+    def vertex_chunks(self, rows: int) -> Iterator[np.ndarray]:
+        for start in range(0, self.vertex_count, rows):
+            yield np.asarray(self.vertices[start:start + rows])
+
+    def triangle_chunks(self, rows: int) -> Iterator[np.ndarray]:
+        """Yield triangle corner positions as ``(n, 3, 3)`` arrays."""
+        for start in range(0, self.face_count, rows):
+            yield self.vertices[np.asarray(self.faces[start:start + rows])]
+
+    def bounds(self, rows: int):
+        lower = np.full(3, np.inf)
+        upper = np.full(3, -np.inf)
+        for chunk in self.vertex_chunks(rows):
+            lower = np.minimum(lower, chunk.min(axis=0))
+            upper = np.maximum(upper, chunk.max(axis=0))
+        return lower, upper
+
+    def remove(self) -> None:
+        """Unmap and delete the intermediate files."""
+        self.vertices = self.faces = None
+        for path in (self.vertices_path, self.faces_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class MeshSpool:
+    """Appends triangles to the intermediate files, one B-rep face at a time."""
+
+    def __init__(self, base_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(base_path)), exist_ok=True)
+        self.vertices_path, self.faces_path = intermediate_paths(base_path)
+        self._vertices = open(self.vertices_path, 'wb')
+        self._faces = open(self.faces_path, 'wb')
+        self.vertex_count = 0
+
+    def append(self, vertices: np.ndarray, faces: np.ndarray) -> None:
+        self._vertices.write(np.ascontiguousarray(vertices, dtype='<f8').tobytes())
+        self._faces.write(np.ascontiguousarray(np.asarray(faces) + self.vertex_count, dtype='<i8').tobytes())
+        self.vertex_count += len(vertices)
+
+    def close(self) -> MappedMesh:
+        self._vertices.close()
+        self._faces.close()
+        return MappedMesh(self.vertices_path, self.faces_path)
+
+    def discard(self) -> None:
+        """Close and delete the partially written files."""
+        self._vertices.close()
+        self._faces.close()
+        for path in (self.vertices_path, self.faces_path):
+            os.remove(path)
+
+
+def intermediate_paths(base_path: str):
+    """Vertex and face file paths of a spooled mesh."""
+    return base_path + '.vertices.f8', base_path + '.faces.i8'
+
+
+def count_clusters(mesh: MappedMesh, origin: np.ndarray, cell_size: float, rows: int) -> int:
+    """Number of occupied grid cells, streaming over the vertices."""
+    seen = np.empty(0, dtype=np.int64)
+    for chunk in mesh.vertex_chunks(rows):
+        seen = np.union1d(seen, cell_keys(chunk, origin, cell_size))
+    return len(seen)
+
+
+class _ClusterAccumulator:
+    """Per-cluster quadric, corner sum, count and bounds, merged chunk by chunk."""
+
+    def __init__(self, quadrics: bool):
+        self.quadrics = quadrics
+        self.parts: List[dict] = []
+        self.pending_rows = 0
+        self.merged: Optional[dict] = None
+
+    @staticmethod
+    def _reduce(keys: np.ndarray, fields: dict) -> dict:
+        unique, inverse = np.unique(keys, return_inverse=True)
+        reduced = {"keys": unique}
+        for name, values in fields.items():
+            if name == "lower":
+                out = np.full((len(unique),) + values.shape[1:], np.inf)
+                np.minimum.at(out, inverse, values)
+            elif name == "upper":
+                out = np.full((len(unique),) + values.shape[1:], -np.inf)
+                np.maximum.at(out, inverse, values)
+            else:
+                out = np.zeros((len(unique),) + values.shape[1:])
+                np.add.at(out, inverse, values)
+            reduced[name] = out
+        return reduced
+
+    def add(self, tri: np.ndarray, keys: np.ndarray) -> None:
+        corners = tri.reshape(-1, 3)
+        fields = {
+            "sum": corners,
+            "count": np.ones(len(corners)),
+            "lower": corners,
+            "upper": corners,
+        }
+        if self.quadrics:
+            A, b = triangle_quadrics(tri)
+            fields["A"] = np.repeat(A, 3, axis=0)
+            fields["b"] = np.repeat(b, 3, axis=0)
+        part = self._reduce(keys.ravel(), fields)
+        self.parts.append(part)
+        self.pending_rows += len(part["keys"])
+
+        # Fold the chunk results together once they outgrow the merged set
+        merged_rows = len(self.merged["keys"]) if self.merged else 0
+        if self.pending_rows > max(merged_rows, len(corners)):
+            self.merge()
+
+    def merge(self) -> dict:
+        parts = self.parts + ([self.merged] if self.merged else [])
+        if parts:
+            keys = np.concatenate([part["keys"] for part in parts])
+            fields = {name: np.concatenate([part[name] for part in parts])
+                      for name in parts[0] if name != "keys"}
+            self.merged = self._reduce(keys, fields)
+        self.parts, self.pending_rows = [], 0
+        return self.merged
+
+
+def _unique_faces(face_keys: np.ndarray) -> np.ndarray:
+    """Drop triangles that collapse to the same three clusters."""
+    if len(face_keys) == 0:
+        return face_keys
+    _, unique_rows = np.unique(np.sort(face_keys, axis=1), axis=0, return_index=True)
+    return face_keys[np.sort(unique_rows)]
+
+
+def cluster_decimate_chunked(mesh: MappedMesh, origin: np.ndarray, cell_size: float,
+                             rows: int, quadrics: bool = True) -> Mesh:
+    """Out-of-core version of :func:`lod.cluster_decimate`.
+
+    Without ``quadrics`` each cluster collapses to the mean of its vertices,
+    which is used to weld coincident vertices at full resolution.
+    """
+    accumulator = _ClusterAccumulator(quadrics)
+    face_parts = []
+    for tri in mesh.triangle_chunks(rows):
+        keys = cell_keys(tri, origin, cell_size)
+        accumulator.add(tri, keys)
+        keep = (keys[:, 0] != keys[:, 1]) & (keys[:, 1] != keys[:, 2]) & (keys[:, 2] != keys[:, 0])
+        face_parts.append(_unique_faces(keys[keep]))
+
+    clusters = accumulator.merge()
+    face_keys = _unique_faces(np.concatenate(face_parts)) if face_parts else np.empty((0, 3), np.int64)
+    del face_parts
+
+    mean = clusters["sum"] / clusters["count"][:, None]
+    if quadrics:
+        positions = solve_cluster_positions(clusters["A"], clusters["b"], mean,
+                                            clusters["lower"], clusters["upper"])
+    else:
+        positions = mean
+
+    faces = np.searchsorted(clusters["keys"], face_keys)
+    used, faces = np.unique(faces, return_inverse=True)
+    return Mesh(positions[used], faces.reshape(-1, 3))
+
+
+def decimate_out_of_core(mesh: MappedMesh, ratio: float, rows: int, max_faces: int) -> Mesh:
+    """Reduce a memory-mapped mesh to about ``ratio`` of its triangles.
+
+    Meshes above ``max_faces`` triangles are treated as if they had
+    ``max_faces``, so that every LOD fits in memory for normal generation and
+    export.
+    """
+    bbox_min, bbox_max = mesh.bounds(rows)
+    diagonal = float(np.linalg.norm(bbox_max - bbox_min)) or 1.0
+    weld_size = diagonal * WELD_RESOLUTION
+
+    # Scale every LOD from the capped size so they stay distinct
+    resident_faces = mesh.face_count
+    if resident_faces > max_faces:
+        log.warning("  - Capping at %d of %d triangles to stay within the memory budget",
+                    max_faces, mesh.face_count)
+        resident_faces = max_faces
+    target_faces = int(round(resident_faces * ratio))
+    if target_faces >= mesh.face_count:
+        return cluster_decimate_chunked(mesh, bbox_min, weld_size, rows, quadrics=False)
+
+    # Search the cell size on vertex counts, which only needs a cheap pass over
+    # the vertices; on a closed surface faces scale with vertices.
+    welded = count_clusters(mesh, bbox_min, weld_size, rows)
+    target_clusters = max(3, int(welded * target_faces / mesh.face_count))
+    low, high = np.log(weld_size), np.log(diagonal)
+    best_size, best_error = diagonal, None
+    for _ in range(SEARCH_PASSES):
+        size = float(np.exp((low + high) / 2.0))
+        count = count_clusters(mesh, bbox_min, size, rows)
+        error = abs(count - target_clusters)
+        if best_error is None or error < best_error:
+            best_size, best_error = size, error
+        if count > target_clusters:
+            low = np.log(size)
+        else:
+            high = np.log(size)
+
+    return cluster_decimate_chunked(mesh, bbox_min, best_size, rows, quadrics=True)
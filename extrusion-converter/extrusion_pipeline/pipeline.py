@@ -0,0 +1,182 @@
+"""
+End-to-end conversion of one STEP file into per-LOD GLBs and metadata
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .freecad import DEFAULT_TOLERANCE, load_step, tessellate, tessellate_to_disk
+from .gltf import export_glb
+from .lod import LOD_RATIOS, build_lods
+from .memory import MemoryBudget
+from .mesh import (Mesh, Orientation, extrusion_orientation, model_id_for, orient_extrusion,
+                   transform_mesh, write_obj)
+from .metadata import build_metadata, metadata_path, write_metadata
+from .normals import DEFAULT_FEATURE_ANGLE, compute_normals
+from .outofcore import decimate_out_of_core, intermediate_paths
+
+log = logging.getLogger(__name__)
+
+STEP_EXTENSIONS = ('.step', '.stp')
+
+
+@dataclass
+class Workspace:
+    """Directory layout shared by the CLI, the Docker image and the storefront."""
+    root: str = '.'
+
+    @property
+    def source_dir(self) -> str:
+        return os.path.join(self.root, 'source')
+
+    @property
+    def intermediate_dir(self) -> str:
+        return os.path.join(self.root, 'intermediate')
+
+    @property
+    def processed_dir(self) -> str:
+        return os.path.join(self.root, 'processed')
+
+    @property
+    def metadata_dir(self) -> str:
+        return os.path.join(self.root, 'metadata')
+
+    @property
+    def catalog_path(self) -> str:
+        return os.path.join(self.processed_dir, 'catalog.json')
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.processed_dir, '.sources.json')
+
+    def glb_path(self, model_id: str, lod: str) -> str:
+        return os.path.join(self.processed_dir, lod, f"{model_id}.glb")
+
+    def metadata_path(self, model_id: str, lod: str) -> str:
+        return metadata_path(self.metadata_dir, model_id, lod)
+
+    def intermediate_path(self, model_id: str) -> str:
+        return os.path.join(self.intermediate_dir, f"{model_id}.obj")
+
+    def spool_base(self, model_id: str) -> str:
+        """Base path of the memory-mapped intermediate used with a memory budget."""
+        return os.path.join(self.intermediate_dir, model_id)
+
+
+@dataclass
+class ConvertOptions:
+    lods: Tuple[str, ...] = ('low', 'medium', 'high')
+    tolerance: float = DEFAULT_TOLERANCE
+    unit: str = 'inch'
+    center: bool = True
+    normalize: bool = True
+    compress: bool = True
+    feature_angle: float = DEFAULT_FEATURE_ANGLE
+    keep_intermediate: bool = False  # OBJ of the tessellation (in-memory path)
+    max_memory: Optional[int] = None  # bytes; enables the out-of-core path
+    keep_spool: bool = False  # raw memory-mapped tessellation (out-of-core path)
+
+
+def find_step_files(source_dir: str) -> List[str]:
+    """All STEP files below ``source_dir``, sorted by path."""
+    step_files = []
+    for directory, _, filenames in os.walk(source_dir):
+        for filename in filenames:
+            if filename.lower().endswith(STEP_EXTENSIONS):
+                step_files.append(os.path.join(directory, filename))
+    return sorted(step_files)
+
+
+def convert_file(step_path: str, workspace: Workspace, options: ConvertOptions) -> Dict[str, Dict]:
+    """Convert one STEP file and return its metadata keyed by LOD.
+
+    With ``options.max_memory`` set, the tessellation is spooled to a
+    memory-mapped intermediate and decimated out-of-core instead of being
+    held in memory; the spool is deleted afterwards unless
+    ``options.keep_spool`` is set. Raises :class:`PipelineError` if any stage fails; outputs
+    of earlier LODs are left in place.
+    """
+    model_id = model_id_for(step_path)
+
+    log.info("  - Loading %s", step_path)
+    shape = load_step(step_path)
+    if options.max_memory:
+        lods, orientation = _budgeted_lods(shape, model_id, workspace, options)
+    else:
+        lods, orientation = _in_memory_lods(shape, model_id, workspace, options)
+    del shape
+
+    results = {}
+    for lod, lod_mesh in lods:
+        glb_path = workspace.glb_path(model_id, lod)
+        file_size = export_glb(lod_mesh, glb_path, name=model_id, compress=options.compress)
+        metadata = build_metadata(model_id, orientation, lod, os.path.basename(glb_path),
+                                  file_size, options.unit)
+        write_metadata(metadata, workspace.metadata_path(model_id, lod))
+        log.info("  ✅ %s: %d triangles, %d vertices, %d bytes",
+                 lod, lod_mesh.face_count, lod_mesh.vertex_count, file_size)
+        results[lod] = metadata
+    return results
+
+
+def _in_memory_lods(shape, model_id: str, workspace: Workspace, options: ConvertOptions):
+    mesh = tessellate(shape, options.tolerance)
+    log.info("  - Tessellated %d triangles", mesh.face_count)
+
+    if options.keep_intermediate:
+        write_obj(mesh, workspace.intermediate_path(model_id))
+
+    mesh, orientation = orient_extrusion(mesh, center=options.center, normalize=options.normalize)
+    return build_lods(mesh, options.lods, options.feature_angle).items(), orientation
+
+
+def _budgeted_lods(shape, model_id: str, workspace: Workspace,
+                   options: ConvertOptions) -> Tuple[Iterator[Tuple[str, Mesh]], Orientation]:
+    budget = MemoryBudget(options.max_memory)
+    mapped = tessellate_to_disk(shape, workspace.spool_base(model_id), options.tolerance)
+    log.info("  - Tessellated %d triangles to %s (%d per chunk)",
+             mapped.face_count, workspace.intermediate_dir, budget.chunk_faces)
+
+    bbox_min, bbox_max = mapped.bounds(budget.chunk_faces)
+    orientation, translation, rotation = extrusion_orientation(
+        bbox_min, bbox_max, center=options.center, normalize=options.normalize)
+
+    def generate():
+        # One LOD is resident at a time; it is exported before the next is built
+        try:
+            for lod in options.lods:
+                reduced = decimate_out_of_core(mapped, LOD_RATIOS[lod], budget.chunk_faces,
+                                               budget.max_resident_faces)
+                vertices, normals, faces = compute_normals(reduced.vertices, reduced.faces,
+                                                           options.feature_angle)
+                del reduced
+                yield lod, transform_mesh(Mesh(vertices, faces, normals), translation, rotation)
+        finally:
+            # Spools of large models run to gigabytes, so they are only kept on request
+            if not options.keep_spool:
+                mapped.remove()
+
+    return generate(), orientation
+
+
+def retire_model(model_id: str, workspace: Workspace) -> List[str]:
+    """Delete every GLB, metadata and intermediate file of a model.
+
+    Returns the paths that were removed.
+    """
+    candidates = [workspace.intermediate_path(model_id)]
+    candidates.extend(intermediate_paths(workspace.spool_base(model_id)))
+    for lod in LOD_RATIOS:
+        candidates.append(workspace.glb_path(model_id, lod))
+        candidates.append(workspace.metadata_path(model_id, lod))
+
+    removed = []
+    for path in candidates:
+        try:
+            os.remove(path)
+            removed.append(path)
+        except FileNotFoundError:
+            pass
+    return removed
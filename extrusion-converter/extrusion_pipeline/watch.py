@@ -0,0 +1,208 @@
+"""
+Continuous incremental conversion driven by inotify
+
+The source directory is watched recursively. Events are collected until the tree
+has been quiet for the debounce interval, so a burst of copied files becomes one
+batch and a file still being written is not converted half-way. Only new or
+modified STEP files are converted and only their catalog entries are refreshed;
+deleted files have their GLBs and metadata retired.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+from typing import Dict, Set
+
+from .errors import PipelineError
+from .manifest import SourceManifest, fingerprint
+from .memory import MemoryBudget
+from .mesh import model_id_for
+from .metadata import update_catalog
+from .pipeline import STEP_EXTENSIONS, ConvertOptions, Workspace, convert_file, find_step_files, retire_model
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE = 2.0
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+class Inotify:
+    """Minimal recursive inotify watcher on top of libc via ctypes."""
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise PipelineError(f"inotify_init1 failed: {os.strerror(errno)}")
+        self.directories: Dict[int, str] = {}
+
+    def add_tree(self, root: str) -> None:
+        """Watch ``root`` and every directory below it."""
+        for directory, _, _ in os.walk(root):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise PipelineError(f"Cannot watch {directory}: {os.strerror(errno)}")
+            self.directories[wd] = directory
+
+    def read(self, timeout: float):
+        """Yield ``(mask, path)`` for events arriving within ``timeout`` seconds."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_IGNORED:
+                self.directories.pop(wd, None)
+                continue
+            directory = self.directories.get(wd)
+            if directory is None and not mask & IN_Q_OVERFLOW:
+                continue
+            path = os.path.join(directory, os.fsdecode(name)) if directory and name else directory
+            yield mask, path
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class Watcher:
+    """Keeps processed/ and the catalog in step with source/."""
+
+    def __init__(self, workspace: Workspace, options: ConvertOptions, debounce: float = DEFAULT_DEBOUNCE):
+        self.workspace = workspace
+        self.options = options
+        self.debounce = debounce
+        self.manifest = SourceManifest(workspace.manifest_path, workspace.source_dir)
+        self.running = False
+
+    def reconcile(self) -> None:
+        """Compare the whole source tree against the manifest and catch up."""
+        current = set(find_step_files(self.workspace.source_dir))
+        recorded = {path for path, _ in self.manifest.items()}
+        self.process(current | recorded)
+
+    def process(self, paths: Set[str]) -> None:
+        """Retire deleted files, then convert new or modified ones.
+
+        Deletions go first and a model is only retired if no existing source
+        still provides its ID, so renames that keep the file name's stem
+        (``a.stp`` to ``a.step``, or a move to another subdirectory) rebuild
+        the model rather than delete the fresh outputs.
+        """
+        existing = sorted(path for path in paths if os.path.exists(path))
+        deleted = sorted(path for path in paths if not os.path.exists(path))
+        touched = set()
+        recorded, forgotten = {}, []
+
+        if deleted:
+            provided = {model_id_for(path) for path in existing}
+            provided.update(model_id for path, model_id in self.manifest.items() if os.path.exists(path))
+            for path in deleted:
+                forgotten.append(path)
+                model_id = model_id_for(path)
+                if model_id in provided:
+                    log.info("Source %s is gone, but %s is still provided by another file", path, model_id)
+                    continue
+                removed = retire_model(model_id, self.workspace)
+                log.info("Retired %s (%d files removed)", model_id, len(removed))
+                touched.add(model_id)
+
+        for path in existing:
+            if not self.manifest.changed(path):
+                continue
+            log.info("Converting %s...", path)
+            try:
+                # Fingerprint first, so edits made during the conversion trigger another one
+                source_fingerprint = fingerprint(path)
+                convert_file(path, self.workspace, self.options)
+            except Exception as e:
+                # Keep watching; the file is retried once it changes again
+                log.error("  ❌ Failed to convert %s: %s", path, e,
+                          exc_info=not isinstance(e, (PipelineError, FileNotFoundError)))
+                continue
+            recorded[path] = source_fingerprint
+            touched.add(model_id_for(path))
+
+        if recorded or forgotten:
+            self.manifest.update(recorded, forgotten)
+        if touched:
+            update_catalog(self.workspace.metadata_dir, self.workspace.catalog_path, touched)
+            log.info("Catalog updated: %s", ', '.join(sorted(touched)))
+            if self.options.max_memory:
+                log.info(MemoryBudget(self.options.max_memory).report())
+
+    def stop(self) -> None:
+        self.running = False
+
+    def run(self) -> None:
+        """Watch until :meth:`stop` is called."""
+        os.makedirs(self.workspace.source_dir, exist_ok=True)
+        inotify = Inotify()
+        try:
+            inotify.add_tree(self.workspace.source_dir)
+            self.reconcile()
+            log.info("Watching %s for STEP files (debounce %.1fs)", self.workspace.source_dir, self.debounce)
+
+            pending: Set[str] = set()
+            rescan = False
+            last_event = 0.0
+            self.running = True
+            while self.running:
+                timeout = self.debounce if (pending or rescan) else 1.0
+                for mask, path in inotify.read(timeout):
+                    last_event = time.monotonic()
+                    if mask & IN_Q_OVERFLOW:
+                        rescan = True
+                    elif mask & IN_ISDIR:
+                        # New directories need watches and may already hold files;
+                        # removed ones take their files with them.
+                        if mask & (IN_CREATE | IN_MOVED_TO) and os.path.isdir(path):
+                            try:
+                                inotify.add_tree(path)
+                            except PipelineError as e:
+                                # E.g. an unpacker's temp directory, already gone again
+                                log.warning("%s", e)
+                        rescan = True
+                    elif path and path.lower().endswith(STEP_EXTENSIONS):
+                        pending.add(path)
+
+                if (pending or rescan) and time.monotonic() - last_event >= self.debounce:
+                    if rescan:
+                        self.reconcile()
+                    else:
+                        self.process(pending)
+                    pending, rescan = set(), False
+        finally:
+            inotify.close()
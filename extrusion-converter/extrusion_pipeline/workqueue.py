@@ -0,0 +1,297 @@
+"""
+Work queue on a shared volume for conversions spread across several containers
+
+Layout under ``ROOT/queue``:
+
+    jobs/MODEL.json      waiting or in-progress job (source path and fingerprint)
+    leases/MODEL.lease   claim by one worker; its mtime is the heartbeat
+    done/MODEL.json      result of the last run of the job
+    failed/MODEL.json    job given up after too many attempts
+
+A worker claims a job by creating its lease with ``O_EXCL`` and keeps touching the
+lease while converting. The heartbeat runs in a small child process rather than
+a thread, so FreeCAD calls that hold the GIL for minutes on huge assemblies do
+not starve it; the child exits as soon as its worker does. Leases whose
+heartbeat stops for longer than the lease timeout belong to dead workers and
+are broken, which puts the job back up for grabs. The timeout is measured on
+each worker's own clock from when it saw the lease's mtime last change, so the
+hosts' clocks need not agree. Every worker writes into the same processed/ and
+metadata/ directories and merges its models into ``processed/catalog.json``
+under a lock, so no broker or coordinator is needed and throughput grows with
+the number of workers.
+"""
+
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .errors import PipelineError
+from .files import StalenessObserver, break_stale, create_exclusive, owner_info, read_json, write_json
+from .manifest import SourceManifest, fingerprint
+from .mesh import model_id_for
+from .metadata import update_catalog
+from .pipeline import ConvertOptions, Workspace, convert_file
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TIMEOUT = 120.0
+DEFAULT_HEARTBEAT = 15.0
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class WorkQueue:
+    """File-based job queue rooted at ``workspace.root/queue``."""
+
+    def __init__(self, workspace: Workspace, lease_timeout: float = DEFAULT_LEASE_TIMEOUT):
+        self.workspace = workspace
+        self.lease_timeout = lease_timeout
+        self.observer = StalenessObserver(lease_timeout)
+        self.root = os.path.join(workspace.root, 'queue')
+        self.jobs_dir = os.path.join(self.root, 'jobs')
+        self.leases_dir = os.path.join(self.root, 'leases')
+        self.done_dir = os.path.join(self.root, 'done')
+        self.failed_dir = os.path.join(self.root, 'failed')
+        for directory in (self.jobs_dir, self.leases_dir, self.done_dir, self.failed_dir):
+            os.makedirs(directory, exist_ok=True)
+
+    def job_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def lease_path(self, job_id: str) -> str:
+        return os.path.join(self.leases_dir, f"{job_id}.lease")
+
+    def enqueue(self, source_path: str) -> str:
+        """Queue a conversion of ``source_path``; re-queuing replaces the job."""
+        job_id = model_id_for(source_path)
+        job = {
+            "id": job_id,
+            "source": os.path.relpath(os.path.abspath(source_path), os.path.abspath(self.workspace.root)),
+            "fingerprint": fingerprint(source_path),
+            "attempts": 0,
+            "enqueued_at": time.time(),
+        }
+        write_json(job, self.job_path(job_id))
+        return job_id
+
+    def pending(self) -> List[str]:
+        """IDs of all queued jobs, claimed or not, oldest first."""
+        names = [name for name in os.listdir(self.jobs_dir)
+                 if name.endswith('.json') and not name.startswith('.')]
+        paths = [os.path.join(self.jobs_dir, name) for name in names]
+        ages = {}
+        for name, path in zip(names, paths):
+            try:
+                ages[name] = os.path.getmtime(path)
+            except FileNotFoundError:
+                pass
+        return [os.path.splitext(name)[0] for name in sorted(ages, key=ages.get)]
+
+    def claim(self, worker_id: str) -> Optional[Dict]:
+        """Lease the oldest unclaimed job, reclaiming expired leases on the way."""
+        for job_id in self.pending():
+            lease_path = self.lease_path(job_id)
+            if os.path.exists(lease_path) and not break_stale(lease_path, self.observer):
+                continue
+            lease = dict(owner_info(), worker=worker_id)
+            if not create_exclusive(lease_path, lease):
+                continue
+
+            # The job may have finished between listing and claiming it
+            job = read_json(self.job_path(job_id))
+            if job is None:
+                self.release(job_id)
+                continue
+            return job
+        return None
+
+    def owns(self, job_id: str, worker_id: str) -> bool:
+        lease = read_json(self.lease_path(job_id))
+        return lease is not None and lease.get("worker") == worker_id
+
+    def heartbeat(self, job_id: str) -> None:
+        try:
+            os.utime(self.lease_path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def release(self, job_id: str) -> None:
+        try:
+            os.unlink(self.lease_path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def complete(self, job: Dict, result: Dict) -> None:
+        """Record the result and drop the job unless it was re-queued meanwhile."""
+        job_id = job["id"]
+        write_json(result, os.path.join(self.done_dir, f"{job_id}.json"))
+        current = read_json(self.job_path(job_id))
+        if current is not None and current.get("fingerprint") == job["fingerprint"]:
+            os.unlink(self.job_path(job_id))
+        self.release(job_id)
+
+    def fail(self, job: Dict, error: str, max_attempts: int) -> None:
+        """Count a failed attempt; give up on the job after ``max_attempts``."""
+        job_id = job["id"]
+        current = read_json(self.job_path(job_id))
+        if current is None or current.get("fingerprint") != job["fingerprint"]:
+            # Re-queued with a new version of the file: give that a fresh start
+            self.release(job_id)
+            return
+
+        job = dict(current, attempts=current.get("attempts", 0) + 1, last_error=error)
+        if job["attempts"] >= max_attempts:
+            write_json(job, os.path.join(self.failed_dir, f"{job_id}.json"))
+            os.unlink(self.job_path(job_id))
+        else:
+            write_json(job, self.job_path(job_id))
+        self.release(job_id)
+
+    def status(self) -> Dict[str, int]:
+        pending = self.pending()
+        leased = sum(1 for job_id in pending if os.path.exists(self.lease_path(job_id)))
+        return {
+            "queued": len(pending) - leased,
+            "running": leased,
+            "done": len(os.listdir(self.done_dir)),
+            "failed": len(os.listdir(self.failed_dir)),
+        }
+
+
+# Run with ``python -I -c``: touches the lease until stopped, until the lease
+# is gone, or until the worker that started it exits
+HEARTBEAT_SCRIPT = """
+import os, sys, time
+path, interval, parent = sys.argv[1], float(sys.argv[2]), int(sys.argv[3])
+while os.getppid() == parent:
+    time.sleep(interval)
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        break
+"""
+
+
+class _Heartbeat:
+    """Touches a job's lease periodically from a child process while the worker converts it."""
+
+    def __init__(self, queue: WorkQueue, job_id: str, interval: float):
+        self.lease_path = queue.lease_path(job_id)
+        self.interval = interval
+        self.process: Optional[subprocess.Popen] = None
+
+    def start(self) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, '-I', '-c', HEARTBEAT_SCRIPT,
+             self.lease_path, str(self.interval), str(os.getpid())],
+            stdin=subprocess.DEVNULL, close_fds=True)
+
+    def stop(self) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+            self.process = None
+
+
+class Worker:
+    """Pulls jobs from a :class:`WorkQueue` and converts them."""
+
+    def __init__(self, workspace: Workspace, options: ConvertOptions, worker_id: Optional[str] = None,
+                 lease_timeout: float = DEFAULT_LEASE_TIMEOUT, heartbeat: float = DEFAULT_HEARTBEAT,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        if heartbeat >= lease_timeout:
+            raise PipelineError("The heartbeat interval must be shorter than the lease timeout")
+        self.workspace = workspace
+        self.options = options
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.queue = WorkQueue(workspace, lease_timeout)
+        self.heartbeat = heartbeat
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.manifest = SourceManifest(workspace.manifest_path, workspace.source_dir)
+        self.running = False
+        self.processed = 0
+
+    def process(self, job: Dict) -> None:
+        job_id = job["id"]
+        source_path = os.path.join(self.workspace.root, job["source"])
+        log.info("[%s] Converting %s...", self.worker_id, source_path)
+
+        heartbeat = _Heartbeat(self.queue, job_id, self.heartbeat)
+        heartbeat.start()
+        started = time.monotonic()
+        try:
+            # Record the state the conversion started from, so an edit made
+            # while it runs is queued again by the next enqueue
+            source_fingerprint = fingerprint(source_path)
+            convert_file(source_path, self.workspace, self.options)
+            error = None
+        except (PipelineError, FileNotFoundError) as e:
+            error = str(e)
+        except Exception as e:
+            # Anything else (OCC, memory, I/O) counts as a failed attempt too,
+            # so a bad file ends up in failed/ instead of killing every worker
+            log.exception("[%s] Unexpected error converting %s", self.worker_id, source_path)
+            error = repr(e)
+        finally:
+            heartbeat.stop()
+
+        if not self.queue.owns(job_id, self.worker_id):
+            # Our lease expired and another worker took over; its result wins
+            log.warning("[%s] Lost the lease on %s, discarding result", self.worker_id, job_id)
+            return
+
+        if error is not None:
+            log.error("[%s] ❌ Failed to convert %s: %s", self.worker_id, source_path, error)
+            self.queue.fail(job, error, self.max_attempts)
+            return
+
+        self.manifest.update(recorded={source_path: source_fingerprint})
+        update_catalog(self.workspace.metadata_dir, self.workspace.catalog_path, [job_id])
+        self.queue.complete(job, {
+            "id": job_id,
+            "worker": self.worker_id,
+            "fingerprint": job["fingerprint"],
+            "seconds": round(time.monotonic() - started, 3),
+            "finished_at": time.time(),
+        })
+        self.processed += 1
+        log.info("[%s] ✅ Finished %s", self.worker_id, job_id)
+
+    def stop(self) -> None:
+        self.running = False
+
+    def run(self, drain: bool = False) -> int:
+        """Process jobs until stopped, or until the queue is empty if ``drain``.
+
+        Returns the number of jobs this worker completed.
+        """
+        self.running = True
+        log.info("[%s] Worker started on %s", self.worker_id, self.queue.root)
+        while self.running:
+            job = self.queue.claim(self.worker_id)
+            if job is not None:
+                try:
+                    self.process(job)
+                except Exception as e:
+                    # E.g. a catalog lock timeout after converting: retry the job later
+                    log.exception("[%s] Failed to finish %s", self.worker_id, job["id"])
+                    if self.queue.owns(job["id"], self.worker_id):
+                        self.queue.fail(job, repr(e), self.max_attempts)
+                continue
+            if drain and not self.queue.pending():
+                break
+            time.sleep(self.poll_interval)
+        log.info("[%s] Worker stopped after %d jobs", self.worker_id, self.processed)
+        return self.processed
+
+
+def enqueue_sources(workspace: Workspace, source_paths: Iterable[str], force: bool = False) -> List[str]:
+    """Queue every new or modified source file (all of them with ``force``)."""
+    queue = WorkQueue(workspace)
+    manifest = SourceManifest(workspace.manifest_path, workspace.source_dir)
+    return [queue.enqueue(path) for path in source_paths if force or manifest.changed(path)]
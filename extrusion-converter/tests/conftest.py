@@ -0,0 +1,58 @@
+import os
+import time
+
+import pytest
+
+from extrusion_pipeline.files import atomic_path
+from extrusion_pipeline.metadata import write_metadata
+from extrusion_pipeline.mesh import model_id_for
+
+
+class FakeConverter:
+    """Stands in for ``convert_file`` without FreeCAD.
+
+    The medium GLB holds a copy of the source, so tests can tell which version
+    of a file it was built from. Every successful conversion appends its model
+    ID to ``ROOT/conversions.log``.
+    """
+
+    def __init__(self, failing=(), delay=0.0, during=None):
+        self.failing = set(failing)
+        self.delay = delay
+        self.during = during
+
+    def __call__(self, step_path, workspace, options):
+        model_id = model_id_for(step_path)
+        if model_id in self.failing:
+            raise ValueError(f"cannot tessellate {model_id}")
+        with open(step_path, 'rb') as f:
+            contents = f.read()
+        if self.during is not None:
+            self.during(step_path)
+        time.sleep(self.delay)
+
+        with atomic_path(workspace.glb_path(model_id, 'medium')) as tmp_path:
+            with open(tmp_path, 'wb') as f:
+                f.write(contents)
+        write_metadata({"id": model_id}, workspace.metadata_path(model_id, 'medium'))
+        # O_APPEND keeps lines from concurrent workers whole
+        with open(os.path.join(workspace.root, 'conversions.log'), 'a') as f:
+            f.write(f"{model_id}\n")
+        return {}
+
+
+@pytest.fixture
+def fake_convert(monkeypatch):
+    """Replace ``convert_file`` in a module: ``fake_convert(module, failing=..., ...)``."""
+    def install(module, **kwargs):
+        converter = FakeConverter(**kwargs)
+        monkeypatch.setattr(module, 'convert_file', converter)
+        return converter
+    return install
+
+
+def write_source(path, contents='ISO-10303-21;'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(contents)
+    return str(path)
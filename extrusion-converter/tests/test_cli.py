@@ -0,0 +1,31 @@
+import os
+
+from extrusion_pipeline import cli
+from extrusion_pipeline.files import read_json
+
+from conftest import write_source
+
+
+def catalog_ids(root):
+    catalog = read_json(os.path.join(root, 'processed', 'catalog.json'))
+    return [model["id"] for model in catalog["models"]]
+
+
+def test_convert_survives_unexpected_errors(tmp_path, fake_convert):
+    for name in ('a.step', 'broken.step', 'c.step'):
+        write_source(tmp_path / 'source' / name)
+    fake_convert(cli, failing={'broken'})
+
+    assert cli.main(['--root', str(tmp_path), 'convert']) == 1
+    assert catalog_ids(tmp_path) == ['a', 'c']
+
+
+def test_convert_survives_sources_deleted_after_conversion(tmp_path, fake_convert):
+    for name in ('a.step', 'b.step'):
+        write_source(tmp_path / 'source' / name)
+    fake_convert(cli, during=lambda path: path.endswith('a.step') and os.remove(path))
+
+    assert cli.main(['--root', str(tmp_path), 'convert']) == 0
+    assert catalog_ids(tmp_path) == ['a', 'b']
+    manifest = read_json(os.path.join(tmp_path, 'processed', '.sources.json'))
+    assert sorted(manifest["sources"]) == ['b.step']
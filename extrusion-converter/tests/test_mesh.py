@@ -0,0 +1,35 @@
+import numpy as np
+
+from extrusion_pipeline.gltf import Z_UP_TO_Y_UP
+from extrusion_pipeline.mesh import Mesh, orient_extrusion
+from extrusion_pipeline.metadata import build_metadata
+
+
+def box_mesh(size):
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=np.float64)
+    return Mesh(corners * size, np.zeros((0, 3), dtype=np.int64))
+
+
+def extents(mesh):
+    low, high = mesh.bounds()
+    return high - low
+
+
+def test_extrusion_along_z_matches_blender_frame():
+    # 1 x 2 profile extruded 10 along FreeCAD's Z, as Blender used to see it
+    mesh, orientation = orient_extrusion(box_mesh([1.0, 2.0, 10.0]))
+    metadata = build_metadata('profile', orientation, 'high', 'profile.glb', 0)
+
+    assert metadata['dimensions'] == {'width': 1.0, 'height': 2.0, 'baseLength': 10.0}
+    assert metadata['extrusionAxis'] == 'x'
+    assert metadata['boundingBox'] == {'min': [0.0, -10.0, 0.0], 'max': [1.0, 0.0, 2.0]}
+    assert np.allclose(mesh.bounds()[0] + mesh.bounds()[1], 0.0)
+    # In the GLB the profile's height is up
+    assert np.allclose(extents(mesh) @ np.abs(Z_UP_TO_Y_UP).T, [10.0, 2.0, 1.0])
+
+
+def test_unnormalized_glb_keeps_freecad_coordinates():
+    mesh, orientation = orient_extrusion(box_mesh([1.0, 2.0, 10.0]), center=False, normalize=False)
+
+    assert np.allclose(mesh.vertices @ Z_UP_TO_Y_UP.T, box_mesh([1.0, 2.0, 10.0]).vertices)
+    assert orientation.extrusion_axis == 'y'
@@ -0,0 +1,118 @@
+import numpy as np
+
+from extrusion_pipeline.lod import build_lods
+from extrusion_pipeline.mesh import Mesh
+from extrusion_pipeline.normals import compute_normals
+
+CUBE_VERTICES = np.array([
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+    [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+], dtype=np.float64)
+
+# Counter-clockwise seen from outside
+CUBE_FACES = np.array([
+    [0, 2, 1], [0, 3, 2],  # -Z
+    [4, 5, 6], [4, 6, 7],  # +Z
+    [0, 1, 5], [0, 5, 4],  # -Y
+    [3, 7, 6], [3, 6, 2],  # +Y
+    [0, 4, 7], [0, 7, 3],  # -X
+    [1, 2, 6], [1, 6, 5],  # +X
+])
+
+
+def icosphere(subdivisions):
+    t = (1.0 + 5 ** 0.5) / 2.0
+    vertices = [[-1, t, 0], [1, t, 0], [-1, -t, 0], [1, -t, 0],
+                [0, -1, t], [0, 1, t], [0, -1, -t], [0, 1, -t],
+                [t, 0, -1], [t, 0, 1], [-t, 0, -1], [-t, 0, 1]]
+    faces = [[0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+             [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+             [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+             [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]]
+    vertices = [np.array(v, dtype=np.float64) / np.linalg.norm(v) for v in vertices]
+    for _ in range(subdivisions):
+        midpoints = {}
+
+        def midpoint(i, j):
+            key = (min(i, j), max(i, j))
+            if key not in midpoints:
+                m = vertices[i] + vertices[j]
+                vertices.append(m / np.linalg.norm(m))
+                midpoints[key] = len(vertices) - 1
+            return midpoints[key]
+
+        refined = []
+        for a, b, c in faces:
+            ab, bc, ca = midpoint(a, b), midpoint(b, c), midpoint(c, a)
+            refined.extend([[a, ab, ca], [b, bc, ab], [c, ca, bc], [ab, bc, ca]])
+        faces = refined
+    return np.array(vertices), np.array(faces, dtype=np.int64)
+
+
+def box(length, subdivisions):
+    """Closed 1 x 1 x ``length`` box with every side split into a grid."""
+    vertices, faces = [], []
+    steps = np.linspace(0.0, 1.0, subdivisions + 1)
+    for axis in range(3):
+        for side in (0.0, 1.0):
+            u_axis, v_axis = [a for a in range(3) if a != axis]
+            start = len(vertices)
+            for u in steps:
+                for v in steps:
+                    point = np.zeros(3)
+                    point[axis], point[u_axis], point[v_axis] = side, u, v
+                    vertices.append(point)
+            n = subdivisions + 1
+            for i in range(subdivisions):
+                for j in range(subdivisions):
+                    a, b = start + i * n + j, start + (i + 1) * n + j
+                    quad = [[a, b, b + 1], [a, b + 1, a + 1]]
+                    # Keep every side facing outwards
+                    flip = (side == 0.0) != (axis == 1)
+                    faces.extend([f[::-1] for f in quad] if flip else quad)
+    vertices = np.array(vertices)
+    vertices[:, 2] *= length
+    return vertices, np.array(faces, dtype=np.int64)
+
+
+def test_cube_splits_every_corner_per_side():
+    vertices, normals, faces = compute_normals(CUBE_VERTICES, CUBE_FACES)
+
+    assert len(vertices) == 24
+    assert len(faces) == 12
+    # Each output vertex has an axis-aligned normal pointing away from the center
+    assert np.allclose(np.abs(normals).max(axis=1), 1.0)
+    assert np.all(np.einsum('ij,ij->i', normals, vertices - 0.5) > 0)
+    # Every face's corners share that side's normal
+    assert np.allclose(normals[faces[:, 0]], normals[faces[:, 1]])
+    assert np.allclose(normals[faces[:, 0]], normals[faces[:, 2]])
+
+
+def test_sphere_is_not_split():
+    vertices, faces = icosphere(3)
+    out_vertices, normals, out_faces = compute_normals(vertices, faces)
+
+    assert len(out_vertices) == len(vertices)
+    assert np.allclose(np.linalg.norm(normals, axis=1), 1.0)
+    # Smooth normals point along the radius
+    radial = out_vertices / np.linalg.norm(out_vertices, axis=1)[:, None]
+    assert np.all(np.einsum('ij,ij->i', normals, radial) > 0.999)
+
+
+def test_wide_feature_angle_merges_cube_corners():
+    vertices, normals, faces = compute_normals(CUBE_VERTICES, CUBE_FACES, feature_angle=100.0)
+
+    assert len(vertices) == 8
+    assert np.allclose(np.linalg.norm(normals, axis=1), 1.0)
+
+
+def test_every_lod_gets_feature_angle_normals():
+    vertices, faces = box(length=8.0, subdivisions=12)
+    lods = build_lods(Mesh(vertices, faces))
+
+    for lod, mesh in lods.items():
+        assert mesh.normals is not None and len(mesh.normals) == mesh.vertex_count, lod
+        # Hard box edges stay split after decimation: every normal is axis-aligned
+        assert np.allclose(np.abs(mesh.normals).max(axis=1), 1.0, atol=1e-6), lod
+    assert lods['low'].face_count < lods['medium'].face_count < lods['high'].face_count
+
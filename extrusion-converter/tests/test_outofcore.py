@@ -0,0 +1,93 @@
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from extrusion_pipeline import pipeline
+from extrusion_pipeline.lod import decimate
+from extrusion_pipeline.mesh import Mesh
+from extrusion_pipeline.outofcore import MeshSpool, decimate_out_of_core
+
+from test_normals import box
+
+
+class FakeFace:
+    def __init__(self, vertices, faces):
+        self.points = [SimpleNamespace(x=x, y=y, z=z) for x, y, z in vertices]
+        self.facets = [tuple(face) for face in faces]
+
+    def tessellate(self, tolerance):
+        return self.points, self.facets
+
+
+def fake_shape(vertices, faces, sides=6):
+    """A B-rep stand-in whose faces tessellate to the sides of a box."""
+    per_side = len(faces) // sides
+    shape_faces = []
+    for side in range(sides):
+        side_faces = faces[side * per_side:(side + 1) * per_side]
+        used, local = np.unique(side_faces, return_inverse=True)
+        shape_faces.append(FakeFace(vertices[used], local.reshape(-1, 3)))
+    return SimpleNamespace(Faces=shape_faces)
+
+
+def spool(tmp_path, vertices, faces):
+    writer = MeshSpool(str(tmp_path / 'model'))
+    shape = fake_shape(vertices, faces)
+    for face in shape.Faces:
+        writer.append(np.array([(p.x, p.y, p.z) for p in face.points]), np.array(face.facets))
+    return writer.close()
+
+
+def test_full_resolution_welds_back_to_the_original(tmp_path):
+    vertices, faces = box(length=4.0, subdivisions=6)
+    mapped = spool(tmp_path, vertices, faces)
+
+    welded = decimate_out_of_core(mapped, 1.0, rows=50, max_faces=10 ** 6)
+
+    assert welded.face_count == len(faces)
+    # Seams between B-rep faces are closed again
+    assert welded.vertex_count == len(np.unique(np.round(vertices, 9), axis=0))
+
+
+@pytest.mark.parametrize('ratio', [0.3, 0.7])
+def test_chunked_decimation_matches_in_memory(tmp_path, ratio):
+    vertices, faces = box(length=4.0, subdivisions=12)
+    mapped = spool(tmp_path, vertices, faces)
+
+    chunked = decimate_out_of_core(mapped, ratio, rows=100, max_faces=10 ** 6)
+    in_memory = decimate(Mesh(vertices, faces), ratio)
+
+    # A coarse uniform grid only reaches the target to within a few cells
+    target = ratio * len(faces)
+    assert abs(chunked.face_count - target) <= 0.2 * target
+    assert abs(in_memory.face_count - target) <= 0.2 * target
+    assert np.allclose(chunked.bounds(), in_memory.bounds())
+
+
+def test_lods_are_capped_and_stay_distinct(tmp_path):
+    vertices, faces = box(length=4.0, subdivisions=12)
+    mapped = spool(tmp_path, vertices, faces)
+    cap = len(faces) // 4
+
+    counts = [decimate_out_of_core(mapped, ratio, rows=100, max_faces=cap).face_count
+              for ratio in (0.3, 0.7, 1.0)]
+
+    assert counts[0] < counts[1] < counts[2] <= cap * 1.1
+
+
+@pytest.mark.parametrize('keep_spool', [False, True])
+def test_spool_is_removed_unless_kept(tmp_path, monkeypatch, keep_spool):
+    vertices, faces = box(length=4.0, subdivisions=4)
+    monkeypatch.setattr(pipeline, 'load_step', lambda path: fake_shape(vertices, faces))
+    workspace = pipeline.Workspace(str(tmp_path))
+    options = pipeline.ConvertOptions(compress=False, max_memory=512 * 1024 ** 2,
+                                      keep_intermediate=True, keep_spool=keep_spool)
+
+    results = pipeline.convert_file('source/profile.step', workspace, options)
+
+    assert set(results) == {'low', 'medium', 'high'}
+    assert results['high']['dimensions'] == {'width': 1.0, 'height': 1.0, 'baseLength': 4.0}
+    spooled = [name for name in os.listdir(workspace.intermediate_dir) if name.startswith('profile.')]
+    assert bool(spooled) == keep_spool
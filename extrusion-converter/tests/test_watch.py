@@ -0,0 +1,147 @@
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+from extrusion_pipeline import watch
+from extrusion_pipeline.errors import PipelineError
+from extrusion_pipeline.files import read_json
+from extrusion_pipeline.pipeline import ConvertOptions, Workspace
+
+from conftest import write_source
+
+
+def catalog_ids(workspace):
+    catalog = read_json(workspace.catalog_path, default={"models": []})
+    return [model["id"] for model in catalog["models"]]
+
+
+def manifest_keys(workspace):
+    return sorted(read_json(workspace.manifest_path, default={}).get("sources", {}))
+
+
+def glb_contents(workspace, model_id):
+    try:
+        with open(workspace.glb_path(model_id, 'medium')) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.05)
+    raise AssertionError("Timed out waiting for the watcher")
+
+
+def test_failed_file_does_not_stop_the_batch(tmp_path, fake_convert):
+    fake_convert(watch, failing={'broken'})
+    paths = {write_source(tmp_path / 'source' / name) for name in ('a.step', 'broken.step', 'c.step')}
+
+    watcher = watch.Watcher(Workspace(str(tmp_path)), ConvertOptions())
+    watcher.process(paths)
+
+    assert not watcher.manifest.changed(str(tmp_path / 'source' / 'a.step'))
+    assert not watcher.manifest.changed(str(tmp_path / 'source' / 'c.step'))
+    # Not recorded, so it is tried again on the next change or reconcile
+    assert watcher.manifest.changed(str(tmp_path / 'source' / 'broken.step'))
+
+
+def test_edit_during_conversion_is_converted_again(tmp_path, fake_convert):
+    path = write_source(tmp_path / 'source' / 'a.step', 'v1')
+    fake_convert(watch, during=lambda p: write_source(p, 'v2, saved mid-conversion'))
+
+    watcher = watch.Watcher(Workspace(str(tmp_path)), ConvertOptions())
+    watcher.process({path})
+
+    assert watcher.manifest.changed(path)
+
+
+def test_file_deleted_during_conversion_is_not_recorded(tmp_path, fake_convert):
+    path = write_source(tmp_path / 'source' / 'a.step')
+    fake_convert(watch, during=os.remove)
+    workspace = Workspace(str(tmp_path))
+
+    watch.Watcher(workspace, ConvertOptions()).process({path})
+
+    assert manifest_keys(workspace) == []
+
+
+@pytest.mark.parametrize('old, new', [
+    ('a.stp', 'a.step'),
+    (os.path.join('vendor', 'a.step'), os.path.join('archive', 'a.step')),
+])
+def test_rename_keeping_model_id_rebuilds_instead_of_retiring(tmp_path, fake_convert, old, new):
+    fake_convert(watch)
+    workspace = Workspace(str(tmp_path))
+    watcher = watch.Watcher(workspace, ConvertOptions())
+    old_path = write_source(tmp_path / 'source' / old)
+    watcher.process({old_path})
+
+    new_path = str(tmp_path / 'source' / new)
+    os.makedirs(os.path.dirname(new_path), exist_ok=True)
+    os.rename(old_path, new_path)
+    watcher.process({old_path, new_path})
+
+    assert catalog_ids(workspace) == ['a']
+    assert glb_contents(workspace, 'a') is not None
+    assert manifest_keys(workspace) == [new]
+    assert not watcher.manifest.changed(new_path)
+
+
+def test_watch_loop(tmp_path, fake_convert, monkeypatch):
+    fake_convert(watch)
+    workspace = Workspace(str(tmp_path))
+    source = tmp_path / 'source'
+    source.mkdir()
+
+    # A directory that vanishes before it can be watched must not stop the daemon
+    add_tree = watch.Inotify.add_tree
+
+    def flaky_add_tree(self, root):
+        if os.path.basename(root) == 'unpacking':
+            raise PipelineError(f"Cannot watch {root}: No such file or directory")
+        add_tree(self, root)
+    monkeypatch.setattr(watch.Inotify, 'add_tree', flaky_add_tree)
+
+    watcher = watch.Watcher(workspace, ConvertOptions(), debounce=0.2)
+    thread = threading.Thread(target=watcher.run, daemon=True)
+    thread.start()
+    try:
+        write_source(source / 'a.stp', 'v1')
+        wait_for(lambda: glb_contents(workspace, 'a') == 'v1')
+        assert catalog_ids(workspace) == ['a']
+
+        (source / 'unpacking').mkdir()
+        write_source(source / 'vendor' / 'b.step', 'b')
+        wait_for(lambda: catalog_ids(workspace) == ['a', 'b'])
+
+        write_source(source / 'a.stp', 'v2 with more geometry')
+        wait_for(lambda: glb_contents(workspace, 'a') == 'v2 with more geometry')
+
+        os.rename(source / 'a.stp', source / 'a.step')
+        wait_for(lambda: manifest_keys(workspace) == ['a.step', os.path.join('vendor', 'b.step')])
+        assert catalog_ids(workspace) == ['a', 'b']
+        assert glb_contents(workspace, 'a') == 'v2 with more geometry'
+
+        (source / 'archive').mkdir()
+        shutil.move(str(source / 'vendor' / 'b.step'), str(source / 'archive' / 'b.step'))
+        wait_for(lambda: manifest_keys(workspace) == ['a.step', os.path.join('archive', 'b.step')])
+        assert catalog_ids(workspace) == ['a', 'b']
+        assert glb_contents(workspace, 'b') == 'b'
+
+        os.remove(source / 'a.step')
+        wait_for(lambda: catalog_ids(workspace) == ['b'])
+        assert glb_contents(workspace, 'a') is None
+        assert not os.path.exists(workspace.metadata_path('a', 'medium'))
+        assert manifest_keys(workspace) == [os.path.join('archive', 'b.step')]
+        assert thread.is_alive()
+    finally:
+        watcher.stop()
+        thread.join(5)
+    assert not thread.is_alive()
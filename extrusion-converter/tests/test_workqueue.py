@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from extrusion_pipeline import workqueue
+from extrusion_pipeline.files import StalenessObserver, break_stale, create_exclusive, read_json
+from extrusion_pipeline.pipeline import ConvertOptions, Workspace
+
+from conftest import write_source
+
+fork = pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(),
+                          reason="needs fork to share the stubbed converter")
+
+
+def run_worker(root, worker_id):
+    worker = workqueue.Worker(Workspace(root), ConvertOptions(), worker_id=worker_id,
+                              lease_timeout=1.0, heartbeat=0.2, poll_interval=0.05, max_attempts=2)
+    worker.run(drain=True)
+
+
+@fork
+def test_workers_share_a_queue(tmp_path, fake_convert):
+    root = str(tmp_path)
+    workspace = Workspace(root)
+    names = [f"part-{i:02d}" for i in range(12)] + ['bad-part', 'stale-part']
+    sources = [write_source(tmp_path / 'source' / f"{name}.step") for name in names]
+    workqueue.enqueue_sources(workspace, sources)
+
+    # A worker that died mid-job left its lease behind, stamped by a host
+    # whose clock runs an hour behind
+    queue = workqueue.WorkQueue(workspace)
+    assert create_exclusive(queue.lease_path('stale-part'), {"worker": "dead"})
+    past = time.time() - 3600
+    os.utime(queue.lease_path('stale-part'), (past, past))
+
+    fake_convert(workqueue, failing={'bad-part'}, delay=0.05)
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=run_worker, args=(root, f"worker-{i}")) for i in range(3)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+    assert [process.exitcode for process in workers] == [0, 0, 0]
+
+    with open(os.path.join(root, 'conversions.log')) as f:
+        converted = f.read().split()
+    good = sorted(name for name in names if name != 'bad-part')
+    assert sorted(converted) == good  # each exactly once, the stale one included
+
+    catalog = read_json(workspace.catalog_path)
+    assert [model["id"] for model in catalog["models"]] == good
+
+    failed = read_json(os.path.join(queue.failed_dir, 'bad-part.json'))
+    assert failed["attempts"] == 2
+    assert 'cannot tessellate' in failed["last_error"]
+    assert queue.status() == {"queued": 0, "running": 0, "done": len(good), "failed": 1}
+    assert os.listdir(queue.leases_dir) == []
+
+
+def test_edit_during_job_is_queued_again(tmp_path, fake_convert):
+    workspace = Workspace(str(tmp_path))
+    path = write_source(tmp_path / 'source' / 'part.step', 'v1')
+    workqueue.enqueue_sources(workspace, [path])
+    fake_convert(workqueue, during=lambda p: write_source(p, 'v2, saved mid-conversion'))
+
+    worker = workqueue.Worker(workspace, ConvertOptions(), poll_interval=0.01)
+    assert worker.run(drain=True) == 1
+
+    assert workqueue.enqueue_sources(workspace, [path]) == ['part']
+
+
+def test_heartbeat_keeps_lease_fresh_while_gil_is_held(tmp_path):
+    queue = workqueue.WorkQueue(Workspace(str(tmp_path)))
+    lease_path = queue.lease_path('job')
+    assert create_exclusive(lease_path, {"worker": "me"})
+    os.utime(lease_path, (0, 0))
+
+    heartbeat = workqueue._Heartbeat(queue, 'job', 0.1)
+    heartbeat.start()
+    try:
+        # Busy loop in this interpreter; a thread-based heartbeat would compete for the GIL
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            pass
+    finally:
+        heartbeat.stop()
+    assert os.path.getmtime(lease_path) > 0
+
+
+def test_skewed_clock_heartbeats_keep_lease(tmp_path):
+    path = str(tmp_path / 'job.lease')
+    assert create_exclusive(path, {"worker": "alive"})
+    observer = StalenessObserver(0.3)
+
+    # The owner's host stamps times an hour in the past, but keeps stamping
+    skewed = time.time() - 3600
+    for beat in range(4):
+        os.utime(path, (skewed + beat, skewed + beat))
+        assert not break_stale(path, observer)
+        time.sleep(0.2)
+
+    # Heartbeats stop: stale after the timeout of local time, not before
+    assert not break_stale(path, observer)
+    time.sleep(0.35)
+    assert break_stale(path, observer)
+    assert os.listdir(tmp_path) == []
+
+
+def test_break_stale_restores_refreshed_file_without_hard_links(tmp_path, monkeypatch):
+    path = str(tmp_path / 'job.lease')
+    assert create_exclusive(path, {"worker": "alive"})
+    observer = StalenessObserver(0.0)
+    observer.is_stale(path)
+
+    # Refreshed by its owner right between the staleness check and the rename
+    rename = os.rename
+
+    def rename_after_heartbeat(src, dst):
+        if src == path:
+            os.utime(path, (1, 1))
+        rename(src, dst)
+    monkeypatch.setattr(os, 'rename', rename_after_heartbeat)
+
+    def no_links(*args):
+        raise OSError(95, "Operation not supported")
+    monkeypatch.setattr(os, 'link', no_links)
+
+    assert not break_stale(path, observer)
+    assert read_json(path) == {"worker": "alive"}
+    assert os.listdir(tmp_path) == ['job.lease']